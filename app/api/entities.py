@@ -8,6 +8,9 @@ import datetime
 
 bp = Blueprint('entities', __name__)
 
+# Largest number of entities accepted by one /entities:batch request
+MAX_BATCH_SIZE = 100
+
 @bp.route('/entities', methods=['POST'])
 @limiter.limit("5 per minute")
 def create_entity():
@@ -63,6 +66,65 @@ def create_entity():
     except Exception as e:
         return error_response(f"Error creating entity: {str(e)}", 500)
 
+@bp.route('/entities:batch', methods=['POST'])
+@limiter.limit("5 per minute")
+def create_entities_batch():
+    """Create several entities in one request, saving changes once"""
+    # Get the latest reference to query_engine
+    query_engine = main_module.query_engine
+    
+    if query_engine is None:
+        # Try to load it once more
+        main_module.load_query_engine()
+        query_engine = main_module.query_engine
+        
+        if query_engine is None:
+            return error_response("No ontology data loaded", 404)
+    
+    # Get request data
+    data = request.get_json()
+    if not data:
+        return error_response("Request body cannot be empty", 400)
+    
+    entities_data = data.get("entities") if isinstance(data, dict) else None
+    if not isinstance(entities_data, list) or not entities_data:
+        return error_response("'entities' must be a non-empty list", 400)
+    if len(entities_data) > MAX_BATCH_SIZE:
+        return error_response(f"A batch can hold at most {MAX_BATCH_SIZE} entities", 400)
+    
+    # Validate the whole batch before creating anything
+    for index, entity_data in enumerate(entities_data):
+        if not isinstance(entity_data, dict):
+            return error_response(f"Entity {index}: must be an object", 400)
+        is_valid, field_errors = validate_entity(entity_data)
+        if not is_valid:
+            field, message = next(iter(field_errors.items()))
+            return error_response(f"Entity {index}: {field}: {message}", 400)
+    
+    # Create entities in request order; any failure rolls back the ones already
+    # created so the batch is all-or-nothing
+    entities = []
+    
+    def rollback():
+        for entity in reversed(entities):
+            query_engine.delete_entity(entity["id"], True)
+    
+    index = 0
+    try:
+        for index, entity_data in enumerate(entities_data):
+            entities.append(query_engine.create_entity(entity_data))
+        
+        # Save changes to disk once for the whole batch
+        query_engine.save_changes()
+    except ValueError as e:
+        rollback()
+        return error_response(f"Entity {index}: {str(e)}", 400)
+    except Exception as e:
+        rollback()
+        return error_response(f"Error creating entities: {str(e)}", 500)
+    
+    return success_response({"entities": entities, "count": len(entities)}, 201)
+
 @bp.route('/entities/<entity_id>', methods=['GET'])
 def get_entity(entity_id):
     """Get entity by ID"""
@@ -0,0 +1,63 @@
+"""
+Startup helpers shared by the CYBERON MCP server entrypoints.
+
+Keeps query engine loading and shutdown signal wiring in one place so every
+entrypoint starts up the same way.
+"""
+
+import asyncio
+import logging
+import os
+import signal
+from typing import Callable, Optional
+
+from app.models.query_engine import CyberneticsQueryEngine
+from app.utils.engine_cache import load_cached_engine
+
+logger = logging.getLogger(__name__)
+
+def load_query_engine(path: str) -> Optional[CyberneticsQueryEngine]:
+    """
+    Load the query engine from an ontology JSON file.
+
+    The file is stat-ed once; the result serves both as the existence check
+    and as the key of the engine's pickle sidecar cache.
+
+    Args:
+        path: Path to the ontology JSON file
+
+    Returns:
+        The loaded query engine, or None if the file is missing or unreadable
+    """
+    path = os.path.abspath(path)
+    try:
+        st = os.stat(path)
+    except OSError as e:
+        logger.error(f"Data file not accessible: {path} ({e})")
+        logger.warning("Running without query engine - some functionality will be limited")
+        return None
+
+    try:
+        query_engine = load_cached_engine(path, CyberneticsQueryEngine, st)
+        logger.info(f"Query engine loaded from {path}")
+        return query_engine
+    except Exception as e:
+        logger.error(f"Failed to load query engine from {path}: {e}")
+        return None
+
+def install_signal_handlers(on_shutdown: Callable[[int], None]) -> None:
+    """
+    Call on_shutdown(signum) on SIGINT/SIGTERM, on the running event loop's thread.
+
+    Must be called from within a running event loop.
+
+    Args:
+        on_shutdown: Callback receiving the signal number
+    """
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, on_shutdown, sig)
+        except NotImplementedError:
+            # Event loops without add_signal_handler (Windows): hand off to the loop thread-safely
+            signal.signal(sig, lambda signum, frame: loop.call_soon_threadsafe(on_shutdown, signum))
@@ -7,7 +7,7 @@ This module provides the core server implementation for the Model Context Protoc
 import json
 import logging
 import uuid
-from typing import Dict, List, Any, Optional, Callable, Tuple
+from typing import Dict, List, Any, Optional, Callable, Tuple, Union
 
 from jsonschema import validate, ValidationError
 from app.mcp.transports import StdioTransport, Transport
@@ -152,14 +152,17 @@ class MCPServer:
         logger.info(f"Registered transport {transport_id} of type {type(transport).__name__}")
         return transport_id
     
-    def create_stdio_transport(self) -> str:
+    def create_stdio_transport(self, binary: bool = False) -> str:
         """
         Create and register a STDIO transport.
         
+        Args:
+            binary: Pass raw UTF-8 bytes to the message handler instead of text
+            
         Returns:
             The transport ID
         """
-        transport = StdioTransport()
+        transport = StdioTransport(binary=binary)
         return self.register_transport(transport)
     
     def set_query_engine(self, engine) -> None:
@@ -182,12 +185,12 @@ class MCPServer:
         set_query_engine_for_tools(engine)
         set_query_engine_for_prompts(engine)
     
-    def handle_message(self, message: str, transport_id: str) -> Optional[str]:
+    def handle_message(self, message: Union[str, bytes], transport_id: str) -> Optional[str]:
         """
         Handle an incoming message from a transport.
         
         Args:
-            message: The raw message string
+            message: The raw message string (or UTF-8 bytes from a binary transport)
             transport_id: The ID of the transport that received the message
             
         Returns:
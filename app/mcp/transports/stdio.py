@@ -92,9 +92,14 @@ class StdioTransport(Transport[StrMessageType]):
 
     Assumes line-delimited JSON messages. Reads from stdin and writes to stdout.
     Uses anyio for asynchronous operations.
+
+    In binary mode the raw UTF-8 lines read from stdin are handed to the
+    message handler as bytes (json.loads parses bytes directly), skipping the
+    text decoding layer on every incoming message.
     """
 
-    def __init__(self):
+    def __init__(self, binary: bool = False):
+        self._binary = binary
         # Use correct type hints from direct import
         self._receive_stream: Optional[TextReceiveStream] = None
         self._send_stream: Optional[TextSendStream] = None
@@ -224,10 +229,17 @@ class StdioTransport(Transport[StrMessageType]):
 
         logger.debug(f"StdioTransport [{self._transport_id}] sending: {message[:100]}{'...' if len(message) > 100 else ''}")
         try:
-            # TextSendStream handles encoding and requires newline for line separation
-            if not message.endswith('\n'):
-                message += '\n'
-            await self._send_stream.send(message)
+            if self._binary:
+                # Byte stream: encode once (if needed) and frame with a newline
+                data = message.encode('utf-8') if isinstance(message, str) else message
+                if not data.endswith(b'\n'):
+                    data += b'\n'
+                await self._send_stream.send(data)
+            else:
+                # TextSendStream handles encoding and requires newline for line separation
+                if not message.endswith('\n'):
+                    message += '\n'
+                await self._send_stream.send(message)
         except (anyio.BrokenResourceError, anyio.ClosedResourceError) as e:
              logger.error(f"StdioTransport [{self._transport_id}] stdout pipe broken or closed: {e}. Closing transport.")
              await self.close() # Ensure closed on send error
@@ -252,10 +264,15 @@ class StdioTransport(Transport[StrMessageType]):
             stdin_stream = StdinByteStream(sys.stdin.buffer)
             stdout_stream = StdoutByteStream(sys.stdout.buffer)
 
-            # Create text streams with explicit UTF-8 encoding and error handling
-            # Use the correctly imported classes
-            self._receive_stream = TextReceiveStream(stdin_stream)
-            self._send_stream = TextSendStream(stdout_stream)
+            if self._binary:
+                # Exchange raw bytes with the handler, no text transcoding
+                self._receive_stream = stdin_stream
+                self._send_stream = stdout_stream
+            else:
+                # Create text streams with explicit UTF-8 encoding and error handling
+                # Use the correctly imported classes
+                self._receive_stream = TextReceiveStream(stdin_stream)
+                self._send_stream = TextSendStream(stdout_stream)
 
             self._stop_event = anyio.Event()
             self._task_group = anyio.create_task_group()
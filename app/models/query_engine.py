@@ -23,6 +23,7 @@ class CyberneticsQueryEngine:
         self.graph: Optional[nx.DiGraph] = None # Initialize as None
         self.structured_ontology: Dict = {}
         self.relationship_index: Dict[str, Tuple[str, str]] = {} # relationship_id -> (source, target)
+        self.load_error: Optional[str] = None # Set when loading failed and the engine fell back to an empty graph
         self.load_data(data_source)
 
     # --- Helper Methods ---
@@ -163,6 +164,7 @@ class CyberneticsQueryEngine:
         Args:
             data_source: Path to JSON file or dictionary with data.
         """
+        self.load_error = None
         try:
             # Handle both file paths and direct data dictionaries
             if isinstance(data_source, str):
@@ -199,6 +201,7 @@ class CyberneticsQueryEngine:
 
         except FileNotFoundError:
              print(f"Error: Data source file not found at '{data_source}'")
+             self.load_error = f"Data source file not found at '{data_source}'"
              # Initialize empty graph on file error
              self.graph = nx.DiGraph()
              self.data = {
@@ -213,6 +216,7 @@ class CyberneticsQueryEngine:
              }
         except json.JSONDecodeError:
             print(f"Error: Could not decode JSON from '{data_source}'")
+            self.load_error = f"Could not decode JSON from '{data_source}'"
             self.graph = nx.DiGraph()
             self.data = {
                 "knowledge_graph": {
@@ -226,6 +230,7 @@ class CyberneticsQueryEngine:
              }
         except Exception as e:
             print(f"An unexpected error occurred during data loading: {e}")
+            self.load_error = str(e)
             self.graph = nx.DiGraph()
             self.data = {
                 "knowledge_graph": {
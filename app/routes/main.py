@@ -3,6 +3,7 @@ from werkzeug.utils import secure_filename
 import os
 import sys
 from app.utils.ontology_parser import extract_markdown_to_json, analyze_ontology_structure
+from app.utils.engine_cache import load_cached_engine
 from app.models.query_engine import CyberneticsQueryEngine
 
 bp = Blueprint('main', __name__)
@@ -16,14 +17,17 @@ def load_query_engine():
     data_file = os.path.join(current_app.config['DATA_FOLDER'], 'cybernetics_ontology.json')
     
     print(f"Looking for data file at: {data_file}")
-    if os.path.exists(data_file):
-        print(f"Data file found, loading query engine with: {data_file}")
-        query_engine = CyberneticsQueryEngine(data_file)
-        print(f"Query engine loaded with {query_engine.graph.number_of_nodes()} nodes and {query_engine.graph.number_of_edges()} edges")
-        return True
-    else:
-        print(f"Data file not found at: {data_file}")
-    return False
+    try:
+        # One stat serves as both the existence check and the engine cache key
+        st = os.stat(data_file)
+    except OSError as e:
+        print(f"Data file not accessible at: {data_file} ({e})")
+        return False
+    
+    print(f"Data file found, loading query engine with: {data_file}")
+    query_engine = load_cached_engine(data_file, CyberneticsQueryEngine, st)
+    print(f"Query engine loaded with {query_engine.graph.number_of_nodes()} nodes and {query_engine.graph.number_of_edges()} edges")
+    return True
 
 @bp.before_app_request
 def load_engine_if_needed():
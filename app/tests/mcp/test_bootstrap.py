@@ -0,0 +1,37 @@
+"""
+Tests for the MCP server startup helpers.
+"""
+
+import json
+
+from app.mcp.bootstrap import load_query_engine
+
+SAMPLE_DATA = {
+    "structured_ontology": {},
+    "knowledge_graph": {
+        "nodes": [
+            {"id": "node1", "label": "First Node", "type": "concept"},
+            {"id": "node2", "label": "Second Node", "type": "concept"}
+        ],
+        "edges": [
+            {"source": "node1", "target": "node2", "label": "related_to"}
+        ]
+    }
+}
+
+class TestLoadQueryEngine:
+    """Test suite for load_query_engine."""
+
+    def test_loads_engine(self, tmp_path):
+        """Test that an existing data file yields a query engine."""
+        data_file = tmp_path / "ontology.json"
+        data_file.write_text(json.dumps(SAMPLE_DATA))
+
+        engine = load_query_engine(str(data_file))
+
+        assert engine is not None
+        assert engine.graph.number_of_nodes() == 2
+
+    def test_missing_file_returns_none(self, tmp_path):
+        """Test that a missing data file yields None instead of raising."""
+        assert load_query_engine(str(tmp_path / "missing.json")) is None
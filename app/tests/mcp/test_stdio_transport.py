@@ -244,6 +244,18 @@ class TestStdioTransport:
                  await transport.send(message_with_newline)
                  mock_output_bytes.send.assert_awaited_once_with(message_with_newline.encode('utf-8'))
 
+    async def test_binary_send_framing(self, message_json_str):
+        transport = StdioTransport(binary=True)
+        # Simulate an active transport writing straight to the byte stream
+        transport._closed = False
+        transport._send_stream = AsyncMock(spec=anyio.abc.ByteSendStream)
+
+        await transport.send(message_json_str)
+        await transport.send(message_json_str.encode('utf-8') + b"\n")
+
+        expected_bytes = (message_json_str + "\n").encode('utf-8')
+        assert transport._send_stream.send.await_args_list == [call(expected_bytes), call(expected_bytes)]
+
     async def test_send_after_close(self, message_json_str):
         transport = StdioTransport()
         assert transport.is_closed()
@@ -0,0 +1,109 @@
+import unittest
+import pytest
+import os
+import json
+import tempfile
+import shutil
+from unittest.mock import MagicMock
+from app.utils.engine_cache import load_cached_engine, CACHE_SUFFIX
+from app.models.query_engine import CyberneticsQueryEngine
+
+# Mark all tests in this module with the 'data_loading' marker
+pytestmark = pytest.mark.data_loading
+
+SAMPLE_DATA = {
+    "structured_ontology": {},
+    "knowledge_graph": {
+        "nodes": [
+            {"id": "node1", "label": "First Node", "type": "concept"},
+            {"id": "node2", "label": "Second Node", "type": "concept"}
+        ],
+        "edges": [
+            {"source": "node1", "target": "node2", "label": "related_to"}
+        ]
+    }
+}
+
+class TestEngineCache(unittest.TestCase):
+    def setUp(self):
+        """Write sample ontology data to a temporary directory"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.data_file = os.path.join(self.temp_dir, 'cybernetics_ontology.json')
+        with open(self.data_file, 'w') as f:
+            json.dump(SAMPLE_DATA, f)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_first_load_builds_and_writes_cache(self):
+        """The engine is built from JSON and a sidecar is written"""
+        engine = load_cached_engine(self.data_file, CyberneticsQueryEngine)
+
+        self.assertIsInstance(engine, CyberneticsQueryEngine)
+        self.assertTrue(os.path.exists(self.data_file + CACHE_SUFFIX))
+
+    def test_second_load_uses_cache(self):
+        """A warm load returns the pickled engine without rebuilding it"""
+        load_cached_engine(self.data_file, CyberneticsQueryEngine)
+
+        factory = MagicMock()
+        engine = load_cached_engine(self.data_file, factory)
+
+        factory.assert_not_called()
+        self.assertEqual(engine.graph.number_of_nodes(), 2)
+        self.assertEqual(engine.graph.number_of_edges(), 1)
+
+    def test_modified_data_file_invalidates_cache(self):
+        """Changing the JSON file forces a rebuild"""
+        load_cached_engine(self.data_file, CyberneticsQueryEngine)
+
+        data = dict(SAMPLE_DATA)
+        data["knowledge_graph"] = {"nodes": [{"id": "only", "label": "Only", "type": "concept"}], "edges": []}
+        with open(self.data_file, 'w') as f:
+            json.dump(data, f)
+
+        engine = load_cached_engine(self.data_file, CyberneticsQueryEngine)
+        self.assertEqual(list(engine.graph.nodes()), ["only"])
+
+    def test_corrupt_cache_falls_back_to_json(self):
+        """An unreadable sidecar is ignored and replaced"""
+        with open(self.data_file + CACHE_SUFFIX, 'wb') as f:
+            f.write(b'not a pickle')
+
+        engine = load_cached_engine(self.data_file, CyberneticsQueryEngine)
+        self.assertEqual(engine.graph.number_of_nodes(), 2)
+
+        factory = MagicMock()
+        load_cached_engine(self.data_file, factory)
+        factory.assert_not_called()
+
+    def test_precomputed_stat_is_used_as_key(self):
+        """A stat result passed by the caller keys the cache like a fresh stat"""
+        load_cached_engine(self.data_file, CyberneticsQueryEngine)
+
+        factory = MagicMock()
+        load_cached_engine(self.data_file, factory, os.stat(self.data_file))
+        factory.assert_not_called()
+
+    def test_failed_load_is_not_cached(self):
+        """An engine that fell back to an empty graph is not written to the sidecar"""
+        with open(self.data_file, 'w') as f:
+            f.write('{"knowledge_graph": {"nodes": [')
+
+        engine = load_cached_engine(self.data_file, CyberneticsQueryEngine)
+
+        self.assertIsNotNone(engine.load_error)
+        self.assertEqual(engine.graph.number_of_nodes(), 0)
+        self.assertFalse(os.path.exists(self.data_file + CACHE_SUFFIX))
+
+    def test_failed_load_is_retried(self):
+        """A transient load failure does not stick to the data file's cache key"""
+        factory = MagicMock(return_value=MagicMock(load_error="Permission denied"))
+        load_cached_engine(self.data_file, factory)
+
+        engine = load_cached_engine(self.data_file, CyberneticsQueryEngine)
+        self.assertIsNone(engine.load_error)
+        self.assertEqual(engine.graph.number_of_nodes(), 2)
+
+if __name__ == '__main__':
+    unittest.main()
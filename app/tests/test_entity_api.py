@@ -375,5 +375,114 @@ class TestEntityAPI(unittest.TestCase):
         self.mock_api_query_engine = self.patcher.start()
 
 
+
+class TestEntityBatchAPI(unittest.TestCase):
+    def setUp(self):
+        """Set up test client with a mock query engine"""
+        self.app = create_app(testing=True)
+        self.client = self.app.test_client()
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        
+        self.mock_query_engine = MagicMock()
+        self.mock_query_engine.create_entity.side_effect = lambda data: {"id": data["label"].lower()}
+        
+        self.patcher = patch('app.routes.main.query_engine', self.mock_query_engine)
+        self.patcher.start()
+    
+    def tearDown(self):
+        """Clean up after tests"""
+        self.patcher.stop()
+        self.app_context.pop()
+    
+    def test_create_entities_batch(self):
+        """Test the POST /entities:batch endpoint creates entities in order and saves once"""
+        entities = [{"label": f"Entity{i}", "type": "concept"} for i in range(3)]
+        
+        response = self.client.post('/api/entities:batch', json={"entities": entities})
+        
+        self.assertEqual(response.status_code, 201)
+        data = json.loads(response.data)
+        self.assertTrue(data['success'])
+        self.assertEqual(data['count'], 3)
+        self.assertEqual([e['id'] for e in data['entities']], ["entity0", "entity1", "entity2"])
+        self.mock_query_engine.save_changes.assert_called_once()
+    
+    def test_create_entities_batch_validation_error(self):
+        """Test that one invalid entity rejects the whole batch"""
+        entities = [{"label": "Valid", "type": "concept"}, {"type": "concept"}]
+        
+        response = self.client.post('/api/entities:batch', json={"entities": entities})
+        
+        self.assertEqual(response.status_code, 400)
+        data = json.loads(response.data)
+        self.assertFalse(data['success'])
+        self.assertIn("Entity 1", data['error'])
+        self.mock_query_engine.create_entity.assert_not_called()
+        self.mock_query_engine.save_changes.assert_not_called()
+    
+    def test_create_entities_batch_rolls_back_on_create_error(self):
+        """Test that an entity rejected during creation removes the ones created before it"""
+        def create_entity(data):
+            if data["label"] == "Duplicate":
+                raise ValueError("Entity already exists")
+            return {"id": data["label"].lower()}
+        self.mock_query_engine.create_entity.side_effect = create_entity
+        entities = [
+            {"label": "First", "type": "concept"},
+            {"label": "Second", "type": "concept"},
+            {"label": "Duplicate", "type": "concept"}
+        ]
+        
+        response = self.client.post('/api/entities:batch', json={"entities": entities})
+        
+        self.assertEqual(response.status_code, 400)
+        data = json.loads(response.data)
+        self.assertFalse(data['success'])
+        self.assertIn("Entity 2", data['error'])
+        deleted = [c.args[0] for c in self.mock_query_engine.delete_entity.call_args_list]
+        self.assertEqual(deleted, ["second", "first"])
+        self.mock_query_engine.save_changes.assert_not_called()
+    
+    def test_create_entities_batch_rolls_back_on_unexpected_error(self):
+        """Test that any failure while creating rolls back the entities created before it"""
+        def create_entity(data):
+            if data["label"] == "Broken":
+                raise RuntimeError("Graph update failed")
+            return {"id": data["label"].lower()}
+        self.mock_query_engine.create_entity.side_effect = create_entity
+        entities = [
+            {"label": "First", "type": "concept"},
+            {"label": "Broken", "type": "concept"}
+        ]
+        
+        response = self.client.post('/api/entities:batch', json={"entities": entities})
+        
+        self.assertEqual(response.status_code, 500)
+        deleted = [c.args[0] for c in self.mock_query_engine.delete_entity.call_args_list]
+        self.assertEqual(deleted, ["first"])
+        self.mock_query_engine.save_changes.assert_not_called()
+    
+    def test_create_entities_batch_non_object_entity(self):
+        """Test that a batch item that is not an object is rejected with its index"""
+        entities = [{"label": "Valid", "type": "concept"}, 1]
+        
+        response = self.client.post('/api/entities:batch', json={"entities": entities})
+        
+        self.assertEqual(response.status_code, 400)
+        data = json.loads(response.data)
+        self.assertIn("Entity 1", data['error'])
+        self.mock_query_engine.create_entity.assert_not_called()
+    
+    def test_create_entities_batch_too_large(self):
+        """Test that batches over the size limit are rejected"""
+        entities = [{"label": f"Entity{i}", "type": "concept"} for i in range(101)]
+        
+        response = self.client.post('/api/entities:batch', json={"entities": entities})
+        
+        self.assertEqual(response.status_code, 400)
+        self.mock_query_engine.create_entity.assert_not_called()
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
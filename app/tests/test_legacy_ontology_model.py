@@ -0,0 +1,47 @@
+import unittest
+import os
+import importlib.util
+
+# old/ is not a package; load the legacy ontology model straight from its file
+_MODULE_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'old', 'cyberon2.py')
+_spec = importlib.util.spec_from_file_location('cyberon2', _MODULE_PATH)
+cyberon2 = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(cyberon2)
+
+class TestOntologyEntityRelationships(unittest.TestCase):
+    def setUp(self):
+        """Create an entity with one valid relationship"""
+        self.entity = cyberon2.OntologyEntity(
+            id="cybernetics",
+            name="Cybernetics",
+            entity_type=cyberon2.OntologyType.CONCEPT
+        )
+        self.entity.add_relationship("wiener", cyberon2.RelationshipType.DEVELOPED_BY, "Founder", 5)
+
+    def test_rejected_strength_leaves_entity_unchanged(self):
+        """A relationship with an invalid strength is not partially added"""
+        before = self.entity.to_dict()
+
+        with self.assertRaises(TypeError):
+            self.entity.add_relationship("ashby", cyberon2.RelationshipType.INFLUENCED, None, 0.5)
+        with self.assertRaises(ValueError):
+            self.entity.add_relationship("ashby", cyberon2.RelationshipType.INFLUENCED, None, 70000)
+
+        self.assertEqual(len(self.entity.target_ids), 1)
+        self.assertEqual(len(self.entity.rel_types), 1)
+        self.assertEqual(len(self.entity.descriptions), 1)
+        self.assertEqual(len(self.entity.strengths), 1)
+        self.assertEqual(len(self.entity.relationships), 1)
+        self.assertEqual(self.entity.to_dict(), before)
+
+    def test_relationship_views_match_arrays(self):
+        """Relationships read back from the parallel arrays"""
+        self.entity.add_relationship("ashby", cyberon2.RelationshipType.INFLUENCED, None, 3)
+
+        rel = self.entity.relationship_at(1)
+        self.assertEqual(rel.target_id, "ashby")
+        self.assertEqual(rel.relationship_type, cyberon2.RelationshipType.INFLUENCED)
+        self.assertEqual(rel.strength, 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -406,6 +406,14 @@ General concepts used across domains.
         self.assertIn(("testent", "test_section", "belongs_to_category"), actual_edges)
         self.assertIn(("testent", "sometarget", "Rel2"), actual_edges)
 
+    def test_parse_markdown_from_line_iterable(self):
+        """Test that parsing an iterable of lines matches parsing the full text."""
+        lines = self.sample_hierarchical_markdown.splitlines(keepends=True)
+        self.assertEqual(
+            parse_markdown_ontology(iter(lines)),
+            parse_markdown_ontology(self.sample_hierarchical_markdown)
+        )
+
 
 if __name__ == '__main__':
     # Ensure the script can find the ontology_parser module if run directly
@@ -0,0 +1,75 @@
+import os
+import pickle
+import sys
+import tempfile
+from typing import Any, Callable, Optional, Tuple
+
+# Suffix of the pickle sidecar written next to the ontology JSON file
+CACHE_SUFFIX = '.pkl'
+
+def _cache_key(data_file: str, st: Optional[os.stat_result] = None) -> Tuple[int, int]:
+    """
+    Build the cache key for a data file from its modification time and size
+
+    Args:
+        data_file: Path to the ontology JSON file
+        st: Stat result for data_file, if the caller already has one
+
+    Returns:
+        Tuple of (mtime in nanoseconds, size in bytes)
+    """
+    if st is None:
+        st = os.stat(data_file)
+    return st.st_mtime_ns, st.st_size
+
+def load_cached_engine(data_file: str, factory: Callable[[str], Any],
+                       st: Optional[os.stat_result] = None) -> Any:
+    """
+    Load a query engine from its pickle sidecar, or build and cache it
+
+    The sidecar (data_file + '.pkl') stores the engine together with the
+    mtime/size of the JSON it was built from, so any change to the JSON
+    file invalidates it. Cache problems are never fatal: the engine is
+    simply rebuilt from the JSON. An engine whose load failed (one with a
+    load_error set, e.g. an empty fallback after a read error) is returned
+    but not cached, so a transient failure is retried on the next load.
+
+    Args:
+        data_file: Path to the ontology JSON file
+        factory: Callable that builds the engine from the JSON path
+        st: Stat result for data_file, to avoid stat-ing it again
+
+    Returns:
+        The loaded query engine
+    """
+    key = _cache_key(data_file, st)
+    cache_file = data_file + CACHE_SUFFIX
+
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_key, engine = pickle.load(f)
+        if cached_key == key:
+            return engine
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Ignoring unreadable engine cache {cache_file}: {e}", file=sys.stderr)
+
+    engine = factory(data_file)
+    if getattr(engine, 'load_error', None):
+        return engine
+
+    # Write atomically so a concurrent reader never sees a partial pickle
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_file) or '.', suffix=CACHE_SUFFIX)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump((key, engine), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_file)
+    except Exception as e:
+        print(f"Could not write engine cache {cache_file}: {e}", file=sys.stderr)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+    return engine
@@ -1,6 +1,7 @@
+import io
 import re
 import json
-from typing import Dict, List, Set, Tuple, Any, Optional
+from typing import Dict, List, Set, Tuple, Any, Optional, Iterable, Union
 
 # --- Utility Functions ---
 
@@ -16,13 +17,15 @@ def make_id(text: str) -> str:
 
 # --- Parsing Function ---
 
-def parse_markdown_ontology(markdown_text: str) -> List[Dict[str, Any]]:
+def parse_markdown_ontology(markdown_text: Union[str, Iterable[str]]) -> List[Dict[str, Any]]:
     """
     Parses a markdown-formatted ontology document with hierarchical headings (H1-H6)
     into a tree structure representing categories and their entities.
 
     Args:
-        markdown_text: Markdown text content.
+        markdown_text: Markdown text content, or an iterable of lines (such as an
+            open file handle) so large documents can be parsed without holding
+            a split copy of the whole file in memory.
 
     Returns:
         A list representing the root categories (H1s) of the ontology tree.
@@ -54,12 +57,11 @@ def parse_markdown_ontology(markdown_text: str) -> List[Dict[str, Any]]:
     last_attribute_line: Optional[str] = None
     last_relationship_line: Optional[str] = None
 
-    lines = markdown_text.strip().split('\n')
+    # Iterate lazily over the lines instead of materializing a split list
+    lines = io.StringIO(markdown_text) if isinstance(markdown_text, str) else markdown_text
 
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-        i += 1 # Increment early for easier continue/processing logic
+    for raw_line in lines:
+        line = raw_line.strip()
 
         if not line: # Skip empty lines
             continue
@@ -217,18 +219,18 @@ def convert_to_knowledge_graph(ontology_tree: List[Dict[str, Any]]) -> Dict[str,
     """
     nodes: List[Dict[str, Any]] = []
     edges: List[Dict[str, Any]] = []
-    node_ids: Set[str] = set() # Keep track of added node IDs to avoid duplicates
+    node_index: Dict[str, Dict[str, Any]] = {} # Added nodes by ID, to avoid duplicates and find placeholders
 
     # Recursive function to process categories and entities
     def process_node(item: Dict[str, Any], parent_category_id: Optional[str]):
-        nonlocal nodes, edges, node_ids # Allow modification of outer scope variables
+        nonlocal nodes, edges, node_index # Allow modification of outer scope variables
 
         item_id = "" # Initialize item_id
 
         # --- A. Process Category Node ---
         if item.get('type') == 'Category':
             item_id = item['id']
-            if item_id not in node_ids:
+            if item_id not in node_index:
                 category_node = {
                     "id": item_id,
                     "label": item['label'],
@@ -237,7 +239,7 @@ def convert_to_knowledge_graph(ontology_tree: List[Dict[str, Any]]) -> Dict[str,
                     "attributes": {} # Categories don't have markdown attributes in this spec
                 }
                 nodes.append(category_node)
-                node_ids.add(item_id)
+                node_index[item_id] = category_node
 
             # Create hierarchy edge if it has a parent
             if parent_category_id:
@@ -280,14 +282,13 @@ def convert_to_knowledge_graph(ontology_tree: List[Dict[str, Any]]) -> Dict[str,
             }
 
             # Add or update node (in case it was added as a target placeholder earlier)
-            existing_node = next((n for n in nodes if n["id"] == item_id), None)
+            existing_node = node_index.get(item_id)
             if existing_node:
                  # Update existing placeholder node with full details
                  existing_node.update(entity_node)
-            elif item_id not in node_ids:
+            else:
                  nodes.append(entity_node)
-                 node_ids.add(item_id)
-            # else: Node already fully defined, ignore (should ideally not happen often with tree traversal)
+                 node_index[item_id] = entity_node
 
             # Create entity-to-category edge
             if parent_category_id:
@@ -307,16 +308,17 @@ def convert_to_knowledge_graph(ontology_tree: List[Dict[str, Any]]) -> Dict[str,
                 target_id = make_id(target_name)
 
                 # Ensure target node exists (create basic placeholder if not)
-                if target_id not in node_ids:
+                if target_id not in node_index:
                     # Basic placeholder - might be updated later if target is defined
-                    nodes.append({
+                    placeholder_node = {
                         "id": target_id,
                         "label": target_name, # Use original name for label
                         "type": "Unknown", # Mark as unknown type initially
                         "description": None,
                         "attributes": {}
-                    })
-                    node_ids.add(target_id)
+                    }
+                    nodes.append(placeholder_node)
+                    node_index[target_id] = placeholder_node
 
                 # Add the relationship edge
                 edges.append({
@@ -443,19 +445,18 @@ def extract_markdown_to_json(input_file: str, output_file: str) -> None:
         output_file: Path to save the output JSON file.
     """
     print(f"Processing Markdown file: {input_file}")
+    # Phase 1: Parse Markdown into hierarchical tree, streaming lines from the file
     try:
         with open(input_file, 'r', encoding='utf-8') as f:
-            markdown_text = f.read()
+            print("Parsing Markdown into hierarchical structure...")
+            ontology_tree = parse_markdown_ontology(f)
     except FileNotFoundError:
         print(f"Error: Input file not found at {input_file}")
         return
-    except Exception as e:
+    except (OSError, UnicodeDecodeError) as e:
         print(f"Error reading input file: {e}")
         return
 
-    # Phase 1: Parse Markdown into hierarchical tree
-    print("Parsing Markdown into hierarchical structure...")
-    ontology_tree = parse_markdown_ontology(markdown_text)
     if not ontology_tree:
         print("Warning: No categories found or parsed from the Markdown.")
         # Decide if processing should stop or continue with empty data
@@ -1,6 +1,30 @@
 from flask import jsonify
 from typing import Dict, Any, Tuple
 
+# Rate limits per endpoint type, built once at import time
+_RATE_LIMITS: Dict[str, str] = {
+    # Write operations are more restricted
+    "create": "5 per minute",
+    "update": "5 per minute",
+    "delete": "5 per minute",
+
+    # Read operations have higher limits
+    "list": "30 per minute",
+    "read": "30 per minute",
+    "search": "30 per minute",
+
+    # Graph operations have moderate limits
+    "graph": "20 per minute",
+    "paths": "20 per minute",
+    "related": "20 per minute",
+
+    # Stats operations have lower limits due to computation
+    "stats": "10 per minute",
+
+    # Default fallback
+    "default": "10 per minute"
+}
+
 def success_response(data: Dict[str, Any], status_code: int = 200) -> Tuple[Any, int]:
     """
     Format a successful response
@@ -45,27 +69,8 @@ def get_rate_limit_for_endpoint(endpoint_type: str) -> str:
     Returns:
         Rate limit string
     """
-    limits = {
-        # Write operations are more restricted
-        "create": "5 per minute",
-        "update": "5 per minute", 
-        "delete": "5 per minute",
-        
-        # Read operations have higher limits
-        "list": "30 per minute",
-        "read": "30 per minute",
-        "search": "30 per minute",
-        
-        # Graph operations have moderate limits
-        "graph": "20 per minute",
-        "paths": "20 per minute",
-        "related": "20 per minute",
-        
-        # Stats operations have lower limits due to computation
-        "stats": "10 per minute",
-        
-        # Default fallback
-        "default": "10 per minute"
-    }
-    
-    return limits.get(endpoint_type.lower(), limits["default"])
\ No newline at end of file
+    try:
+        # Fast path: endpoint types are normally passed in lowercase already
+        return _RATE_LIMITS[endpoint_type]
+    except KeyError:
+        return _RATE_LIMITS.get(endpoint_type.lower(), _RATE_LIMITS["default"])
\ No newline at end of file
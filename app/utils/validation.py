@@ -52,7 +52,7 @@ def validate_entity(data: Dict[str, Any]) -> Tuple[bool, Optional[Dict[str, str]
             if invalid_attrs:
                 errors["attributes"] = f"The following attribute values must be simple types (string, number, boolean): {', '.join(invalid_attrs)}"
     
-    return len(errors) == 0, errors if errors else None
+    return not errors, errors or None
 
 def validate_entity_update(data: Dict[str, Any]) -> Tuple[bool, Optional[Dict[str, str]]]:
     """
@@ -99,7 +99,7 @@ def validate_entity_update(data: Dict[str, Any]) -> Tuple[bool, Optional[Dict[st
             if invalid_attrs:
                 errors["attributes"] = f"The following attribute values must be simple types (string, number, boolean): {', '.join(invalid_attrs)}"
     
-    return len(errors) == 0, errors if errors else None
+    return not errors, errors or None
 
 def validate_relationship(data: Dict[str, Any]) -> Tuple[bool, Optional[Dict[str, str]]]:
     """
@@ -156,7 +156,7 @@ def validate_relationship(data: Dict[str, Any]) -> Tuple[bool, Optional[Dict[str
             if invalid_attrs:
                 errors["attributes"] = f"The following attribute values must be simple types (string, number, boolean): {', '.join(invalid_attrs)}"
     
-    return len(errors) == 0, errors if errors else None
+    return not errors, errors or None
 
 def validate_relationship_update(data: Dict[str, Any]) -> Tuple[bool, Optional[Dict[str, str]]]:
     """
@@ -194,4 +194,4 @@ def validate_relationship_update(data: Dict[str, Any]) -> Tuple[bool, Optional[D
             if invalid_attrs:
                 errors["attributes"] = f"The following attribute values must be simple types (string, number, boolean): {', '.join(invalid_attrs)}"
     
-    return len(errors) == 0, errors if errors else None
\ No newline at end of file
+    return not errors, errors or None
\ No newline at end of file
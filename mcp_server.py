@@ -2,12 +2,11 @@
 import logging
 import sys
 import os
-import signal
 import asyncio
 
+from app.mcp.bootstrap import install_signal_handlers, load_query_engine
 from app.mcp.server import MCPServer
 from app.mcp.transports import StdioTransport
-from app.models.query_engine import CyberneticsQueryEngine
 
 # Setup logging (as before)
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
@@ -15,6 +14,8 @@ logger = logging.getLogger(__name__)
 
 # --- Configuration ---
 DATA_FILE = os.getenv("CYBERON_DATA_PATH", "app/data/cybernetics_ontology.json")
+# Exchange raw bytes on stdio instead of decoded text (set to "1" to enable)
+BINARY_STDIO = os.getenv("CYBERON_BINARY_STDIO", "0") == "1"
 
 # --- Global Server Instance ---
 # Consider if a global is the best approach, but keep for consistency for now
@@ -25,23 +26,19 @@ async def main(): # Make main asynchronous
     global server
     logger.info("Starting CYBERON MCP Server...")
 
+    # Dispatch shutdown signals on the event loop thread so shutdown_event.wait()
+    # wakes up immediately
+    install_signal_handlers(handle_shutdown_signal)
+
     # --- Initialize Server ---
     server = MCPServer()
 
-    query_engine = None
-    if os.path.exists(DATA_FILE):
-        try:
-            query_engine = CyberneticsQueryEngine(DATA_FILE)
-            server.set_query_engine(query_engine)
-            logger.info(f"Query engine loaded from {DATA_FILE}")
-        except Exception as e:
-            logger.error(f"Failed to load query engine from {DATA_FILE}: {e}")
-    else:
-        logger.error(f"Data file not found: {DATA_FILE}")
-        logger.warning("Running without query engine - some functionality will be limited")
+    query_engine = load_query_engine(DATA_FILE)
+    if query_engine is not None:
+        server.set_query_engine(query_engine)
 
     # --- Initialize Transport ---
-    stdio_transport = StdioTransport()
+    stdio_transport = StdioTransport(binary=BINARY_STDIO)
 
     # --- Configure Transport BEFORE async with ---
     # The server knows its own message handler
@@ -73,16 +70,12 @@ async def main(): # Make main asynchronous
     finally:
         logger.info("StdioTransport context finished.")
 
-def handle_shutdown_signal(sig, frame):
+def handle_shutdown_signal(sig):
     logger.warning(f"Received signal {sig}, initiating shutdown...")
     # Set the asyncio event to stop the main loop waiting
     shutdown_event.set()
 
 if __name__ == "__main__":
-    # Register signal handlers for graceful shutdown
-    signal.signal(signal.SIGINT, handle_shutdown_signal) # Handle Ctrl+C
-    signal.signal(signal.SIGTERM, handle_shutdown_signal) # Handle termination signals
-
     try:
         # Run the main async function using asyncio.run()
         asyncio.run(main())
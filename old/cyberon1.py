@@ -1,12 +1,76 @@
 import networkx as nx
-import matplotlib.pyplot as plt
-import pandas as pd
+import numpy as np
 import json
-from pyvis.network import Network
+import os
+import copy
+from functools import reduce
+
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library json module
+    orjson = None
+
+# Node colors for visualize(): people get PERSON_COLOR, concepts are colored by category
+PERSON_COLOR = '#ff6347'
+DEFAULT_COLOR = '#cccccc'
+COLOR_MAP = {
+    'foundations': '#66c2a5',
+    'information_theory': '#fc8d62',
+    'systems_theory': '#8da0cb',
+    'cognitive': '#e78ac3',
+    'ai': '#a6d854',
+    'applications': '#ffd92f'
+}
 
 class CyberneticsKnowledgeGraph:
     def __init__(self):
         self.graph = nx.DiGraph()
+        self._csr = None
+        self._attr_index = None
+        self._node_link_data = None
+        self._node_link_payload = None
+        # (start, end) -> shortest path tuple or None; cleared on every mutation
+        self._paths = {}
+    
+    def _touch(self):
+        """Invalidate derived structures after the graph changed"""
+        self._csr = None
+        self._attr_index = None
+        self._node_link_data = None
+        self._node_link_payload = None
+        self._paths.clear()
+        
+    def build_csr(self):
+        """Flatten the graph into CSR arrays for fast neighbor scans
+        
+        Nodes are numbered in graph order; the out-neighbors of node i are
+        indices[indptr[i]:indptr[i+1]] and etype holds the code of each
+        edge's relationship type (see rel_codes).
+        """
+        names = list(self.graph)
+        index = {name: i for i, name in enumerate(names)}
+        rel_codes = {}
+        indptr = np.zeros(len(names) + 1, dtype=np.int32)
+        indices = np.empty(self.graph.number_of_edges(), dtype=np.int32)
+        etype = np.empty(self.graph.number_of_edges(), dtype=np.int32)
+        
+        pos = 0
+        for i, name in enumerate(names):
+            for target, attrs in self.graph.adj[name].items():
+                indices[pos] = index[target]
+                etype[pos] = rel_codes.setdefault(attrs.get('type'), len(rel_codes))
+                pos += 1
+            indptr[i + 1] = pos
+        
+        self._csr = {
+            'names': names,
+            'index': index,
+            'rel_codes': rel_codes,
+            'indptr': indptr,
+            'indices': indices,
+            'etype': etype
+        }
+        return self._csr
         
     def add_concept(self, name, category, description=None, properties=None):
         """Add a concept node to the graph"""
@@ -15,6 +79,7 @@ class CyberneticsKnowledgeGraph:
                            category=category,
                            description=description,
                            properties=properties or {})
+        self._touch()
         
     def add_person(self, name, era=None, contributions=None, description=None):
         """Add a person node to the graph"""
@@ -23,93 +88,160 @@ class CyberneticsKnowledgeGraph:
                            era=era,
                            contributions=contributions or [],
                            description=description)
+        self._touch()
     
     def add_relationship(self, source, target, relationship_type, properties=None):
         """Add a relationship between nodes"""
         self.graph.add_edge(source, target, 
                            type=relationship_type,
                            properties=properties or {})
+        self._touch()
     
     def get_related_concepts(self, concept, relationship_type=None):
         """Get concepts related to the given concept"""
-        if concept not in self.graph:
+        csr = self._csr or self.build_csr()
+        i = csr['index'].get(concept)
+        if i is None:
             return []
-            
+        
+        start, end = csr['indptr'][i], csr['indptr'][i + 1]
+        targets = csr['indices'][start:end]
         if relationship_type:
-            return [target for target in self.graph.neighbors(concept) 
-                    if self.graph.edges[concept, target]['type'] == relationship_type]
-        else:
-            return list(self.graph.neighbors(concept))
+            code = csr['rel_codes'].get(relationship_type)
+            if code is None:
+                return []
+            targets = targets[csr['etype'][start:end] == code]
+        
+        names = csr['names']
+        return [names[j] for j in targets]
     
-    def get_concept_path(self, start_concept, end_concept):
-        """Find paths between concepts"""
+    def _shortest_path(self, start_concept, end_concept):
+        """Uncached shortest path lookup"""
         try:
-            return nx.shortest_path(self.graph, start_concept, end_concept)
+            return tuple(nx.shortest_path(self.graph, start_concept, end_concept))
         except (nx.NetworkXNoPath, nx.NodeNotFound):
             return None
     
-    def visualize(self, output_file='cybernetics_graph.html'):
-        """Create an interactive visualization of the graph"""
+    def get_concept_path(self, start_concept, end_concept):
+        """Find paths between concepts"""
+        key = (start_concept, end_concept)
+        try:
+            path = self._paths[key]
+        except KeyError:
+            path = self._paths[key] = self._shortest_path(start_concept, end_concept)
+        return list(path) if path is not None else None
+    
+    def visualize(self, output_file='cybernetics_graph.html', controls=False):
+        """Create an interactive visualization of the graph
+        
+        Set controls=True to embed the pyvis physics/options panel.
+        """
+        # Imported here so loading/querying graphs doesn't pay for pyvis
+        from pyvis.network import Network
+        
         net = Network(notebook=False, height="750px", width="100%", directed=True)
         
-        # Add nodes with colors based on type
+        # Build the node and edge dicts pyvis would create, in one pass each; per-call
+        # add_node() checks membership against a list, which is quadratic overall
+        # (as does add_nodes(), which loops over it). These are pyvis 0.3.2's internal
+        # shapes, pinned in requirements.txt
+        color_get = COLOR_MAP.get
+        nodes = []
         for node, attrs in self.graph.nodes(data=True):
             if attrs.get('type') == 'person':
-                color = '#ff6347'  # Red for people
+                color = PERSON_COLOR
             else:
-                category = attrs.get('category', '')
-                # Different colors for different concept categories
-                color_map = {
-                    'foundations': '#66c2a5',
-                    'information_theory': '#fc8d62',
-                    'systems_theory': '#8da0cb',
-                    'cognitive': '#e78ac3',
-                    'ai': '#a6d854',
-                    'applications': '#ffd92f'
-                }
-                color = color_map.get(category, '#cccccc')  # Default gray
-                
-            net.add_node(node, label=node, title=attrs.get('description', ''), color=color)
+                color = color_get(attrs.get('category', ''), DEFAULT_COLOR)
+            nodes.append({'id': node, 'label': node, 'shape': 'dot',
+                          'title': attrs.get('description', ''), 'color': color})
+        
+        net.nodes = nodes
+        net.node_ids = [n['id'] for n in nodes]
+        net.node_map = {n['id']: n for n in nodes}
         
         # Add edges with labels
-        for source, target, attrs in self.graph.edges(data=True):
-            net.add_edge(source, target, title=attrs.get('type', ''))
+        net.edges = [{'from': source, 'to': target, 'title': attrs.get('type', ''), 'arrows': 'to'}
+                     for source, target, attrs in self.graph.edges(data=True)]
         
         # Set physics layout options
         net.barnes_hut(spring_length=200)
-        net.show_buttons()
+        if controls:
+            net.show_buttons()
         net.save_graph(output_file)
         return output_file
     
     def to_json(self, filename=None):
-        """Export the graph to JSON format"""
-        data = nx.node_link_data(self.graph)
+        """Export the graph to JSON format
+        
+        The node-link data and its serialized form are reused until the graph
+        changes; callers get their own copy of the data.
+        """
+        data = self._node_link_data
+        if data is None:
+            data = self._node_link_data = nx.node_link_data(self.graph)
         if filename:
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=2)
-        return data
+            payload = self._node_link_payload
+            if payload is None:
+                if orjson is not None:
+                    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+                else:
+                    payload = json.dumps(data, indent=2).encode('utf-8')
+                self._node_link_payload = payload
+            # Write to a temp file and swap it in, so readers never see a truncated export
+            tmp_filename = filename + '.tmp'
+            with open(tmp_filename, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_filename, filename)
+        return copy.deepcopy(data)
     
     def from_json(self, data_or_filename):
         """Import the graph from JSON format"""
         if isinstance(data_or_filename, str):
-            with open(data_or_filename, 'r') as f:
-                data = json.load(f)
+            with open(data_or_filename, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         else:
             data = data_or_filename
             
         self.graph = nx.node_link_graph(data)
+        self._touch()
         return self
     
+    def _build_attr_index(self):
+        """Build the attribute -> value -> node set index used by query"""
+        by_attr = {}
+        order = {}
+        for position, (node, attrs) in enumerate(self.graph.nodes(data=True)):
+            order[node] = position
+            for key, value in attrs.items():
+                try:
+                    by_attr.setdefault(key, {}).setdefault(value, set()).add(node)
+                except TypeError:
+                    # Unhashable values (lists, dicts) are matched by scanning instead
+                    pass
+        self._attr_index = (by_attr, order)
+        return self._attr_index
+    
     def query(self, **kwargs):
         """Query nodes based on attributes"""
+        by_attr, order = self._attr_index or self._build_attr_index()
+        
+        indexed = []
+        residual = {}
+        for key, value in kwargs.items():
+            try:
+                indexed.append(by_attr.get(key, {}).get(value, set()))
+            except TypeError:
+                residual[key] = value
+        
+        candidates = reduce(set.intersection, indexed) if indexed else order
+        nodes = self.graph.nodes
         results = []
-        for node, attrs in self.graph.nodes(data=True):
-            match = True
-            for key, value in kwargs.items():
-                if key not in attrs or attrs[key] != value:
-                    match = False
-                    break
-            if match:
+        for node in sorted(candidates, key=order.__getitem__):
+            attrs = nodes[node]
+            if all(key in attrs and attrs[key] == value for key, value in residual.items()):
                 results.append((node, attrs))
         return results
 
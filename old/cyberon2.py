@@ -1,9 +1,31 @@
-from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Set, Union
+from dataclasses import dataclass, field, fields
+from array import array
+from typing import List, Dict, Optional, Set, Tuple, Union
 from enum import Enum
+from collections import defaultdict
 import json
+import sys
+import time
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library json module
+    orjson = None
+
+if orjson is not None:
+    def _dumps_indented(data) -> bytes:
+        """Serialize to 2-space indented UTF-8 JSON"""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    
+    _loads = orjson.loads
+else:
+    def _dumps_indented(data) -> bytes:
+        """Serialize to 2-space indented UTF-8 JSON"""
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    _loads = json.loads
+
 class OntologyType(Enum):
     CONCEPT = "concept"
     PERSON = "person"
@@ -23,7 +45,27 @@ class RelationshipType(Enum):
     COMPARABLE_TO = "comparable_to"
     CONTRADICTS = "contradicts"
 
-@dataclass
+# Value -> member tables for deserialization; plain dict lookups are cheaper than Enum calls
+_TYPE_BY_VALUE = {m.value: m for m in OntologyType}
+
+def _intern(value):
+    """Intern ids so repeated references share one string object; non-strings pass through"""
+    return sys.intern(value) if type(value) is str else value
+
+# Entities store relationship types as small integer codes indexing _REL_TYPES
+_REL_TYPES = tuple(RelationshipType)
+_REL_CODES = {m: code for code, m in enumerate(_REL_TYPES)}
+_REL_CODE_BY_VALUE = {m.value: code for code, m in enumerate(_REL_TYPES)}
+
+def _check_strength(strength) -> int:
+    """Validate a relationship strength for the int16 strengths array"""
+    if isinstance(strength, bool) or not isinstance(strength, int):
+        raise TypeError(f"relationship strength must be an int (1-10 scale), got {strength!r}")
+    if not -32768 <= strength <= 32767:
+        raise ValueError(f"relationship strength out of range: {strength}")
+    return strength
+
+@dataclass(slots=True)
 class TimeFrame:
     start_year: Optional[int] = None
     end_year: Optional[int] = None
@@ -38,35 +80,108 @@ class TimeFrame:
             return f"{self.start_year}-present"
         return "unknown timeframe"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Relationship:
+    """A single relationship; entities hand these out as read-only views of their relationship arrays"""
     target_id: str
     relationship_type: RelationshipType
     description: Optional[str] = None
     strength: int = 1  # 1-10 scale for connection strength
+    
+    def to_dict(self):
+        """Convert to dictionary representation"""
+        return {
+            "target": self.target_id,
+            "type": self.relationship_type.value,
+            "description": self.description,
+            "strength": self.strength
+        }
 
-@dataclass
+@dataclass(slots=True)
 class OntologyEntity:
+    # Attribute -> expression reading it from a to_dict() representation `d`
+    # (with `_get = d.get`, `rels` = its relationships and `tf` = its timeframe);
+    # compiled into a deserializer per class, see _compile_deserializer
+    _JSON_FIELDS = {
+        "id": '_intern(_get("id"))',
+        "name": '_get("name")',
+        "entity_type": '_TYPE_BY_VALUE[_get("type")]',
+        "description": '_get("description", "")',
+        "target_ids": '[_intern(r.get("target")) for r in rels]',
+        "rel_types": 'array("B", [_REL_CODE_BY_VALUE[r.get("type")] for r in rels])',
+        "descriptions": '[r.get("description") for r in rels]',
+        "strengths": 'array("h", [_check_strength(r.get("strength", 1)) for r in rels])',
+        "timeframe": 'TimeFrame(tf.get("start_year"), tf.get("end_year"), tf.get("period_name")) if tf else None',
+        "tags": 'set(_get("tags", []))',
+        "references": '_get("references", [])',
+        "metadata": '_get("metadata", {})'
+    }
+    
     id: str
     name: str
     entity_type: OntologyType
     description: str = ""
-    relationships: List[Relationship] = field(default_factory=list)
+    # Relationships as parallel arrays (one slot per relationship), not Relationship objects
+    target_ids: List[str] = field(default_factory=list)
+    rel_types: array = field(default_factory=lambda: array('B'))  # codes into _REL_TYPES
+    descriptions: List[Optional[str]] = field(default_factory=list)
+    strengths: array = field(default_factory=lambda: array('h'))  # 1-10 scale for connection strength
     timeframe: Optional[TimeFrame] = None
     tags: Set[str] = field(default_factory=set)
     references: List[str] = field(default_factory=list)
     metadata: Dict = field(default_factory=dict)
     
+    def __post_init__(self):
+        self.id = _intern(self.id)
+    
     def add_relationship(self, target_id: str, rel_type: RelationshipType, 
                          description: str = None, strength: int = 1):
         """Add a relationship to another entity"""
-        self.relationships.append(
-            Relationship(target_id=target_id, 
-                        relationship_type=rel_type,
-                        description=description,
-                        strength=strength)
+        # Validate before appending so a rejected relationship leaves the arrays aligned
+        code = _REL_CODES[rel_type]
+        strength = _check_strength(strength)
+        self.target_ids.append(_intern(target_id))
+        self.rel_types.append(code)
+        self.descriptions.append(description)
+        self.strengths.append(strength)
+    
+    def relationship_at(self, index: int) -> Relationship:
+        """The relationship stored at the given position of the relationship arrays"""
+        return Relationship(
+            target_id=self.target_ids[index],
+            relationship_type=_REL_TYPES[self.rel_types[index]],
+            description=self.descriptions[index],
+            strength=self.strengths[index]
         )
     
+    @property
+    def relationships(self) -> Tuple[Relationship, ...]:
+        """All relationships as read-only Relationship views; use add_relationship to add one"""
+        return tuple(self.relationship_at(i) for i in range(len(self.target_ids)))
+    
+    def _relationship_dicts(self) -> List[Dict]:
+        """Relationships in their to_dict() form, read straight from the arrays"""
+        return [
+            {
+                "target": target_id,
+                "type": _REL_TYPES[code].value,
+                "description": description,
+                "strength": strength
+            } for target_id, code, description, strength in zip(
+                self.target_ids, self.rel_types, self.descriptions, self.strengths)
+        ]
+    
+    def _timeframe_dict(self):
+        """Timeframe as a dictionary, or None if not set"""
+        tf = self.timeframe
+        if not tf:
+            return None
+        return {
+            "start_year": tf.start_year,
+            "end_year": tf.end_year,
+            "period_name": tf.period_name
+        }
+    
     def to_dict(self):
         """Convert to dictionary representation"""
         return {
@@ -74,72 +189,210 @@ class OntologyEntity:
             "name": self.name,
             "type": self.entity_type.value,
             "description": self.description,
-            "relationships": [
-                {
-                    "target": r.target_id,
-                    "type": r.relationship_type.value,
-                    "description": r.description,
-                    "strength": r.strength
-                } for r in self.relationships
-            ],
-            "timeframe": {
-                "start_year": self.timeframe.start_year if self.timeframe else None,
-                "end_year": self.timeframe.end_year if self.timeframe else None,
-                "period_name": self.timeframe.period_name if self.timeframe else None
-            } if self.timeframe else None,
+            "relationships": self._relationship_dicts(),
+            "timeframe": self._timeframe_dict(),
             "tags": list(self.tags),
             "references": self.references,
             "metadata": self.metadata
         }
 
-@dataclass
+@dataclass(slots=True)
 class Person(OntologyEntity):
     birth_year: Optional[int] = None
     death_year: Optional[int] = None
     contributions: List[str] = field(default_factory=list)
     institutions: List[str] = field(default_factory=list)
     
+    _JSON_FIELDS = {
+        **OntologyEntity._JSON_FIELDS,
+        "entity_type": 'OntologyType.PERSON',
+        "birth_year": '_get("birth_year")',
+        "death_year": '_get("death_year")',
+        "contributions": '_get("contributions", [])',
+        "institutions": '_get("institutions", [])'
+    }
+    
     def __post_init__(self):
+        super(Person, self).__post_init__()
         if self.entity_type != OntologyType.PERSON:
             self.entity_type = OntologyType.PERSON
 
     def to_dict(self):
-        person_dict = super().to_dict()
-        person_dict.update({
+        # Built in one literal rather than updating the base dict
+        return {
+            "id": self.id,
+            "name": self.name,
+            "type": self.entity_type.value,
+            "description": self.description,
+            "relationships": self._relationship_dicts(),
+            "timeframe": self._timeframe_dict(),
+            "tags": list(self.tags),
+            "references": self.references,
+            "metadata": self.metadata,
             "birth_year": self.birth_year,
             "death_year": self.death_year,
             "contributions": self.contributions,
             "institutions": self.institutions
-        })
-        return person_dict
+        }
 
-@dataclass
+@dataclass(slots=True)
 class Concept(OntologyEntity):
     related_concepts: List[str] = field(default_factory=list)
     formalized_by: List[str] = field(default_factory=list)
     
+    _JSON_FIELDS = {
+        **OntologyEntity._JSON_FIELDS,
+        "entity_type": 'OntologyType.CONCEPT',
+        "related_concepts": '_get("related_concepts", [])',
+        "formalized_by": '_get("formalized_by", [])'
+    }
+    
     def __post_init__(self):
+        super(Concept, self).__post_init__()
         if self.entity_type != OntologyType.CONCEPT:
             self.entity_type = OntologyType.CONCEPT
     
     def to_dict(self):
-        concept_dict = super().to_dict()
-        concept_dict.update({
+        # Built in one literal rather than updating the base dict
+        return {
+            "id": self.id,
+            "name": self.name,
+            "type": self.entity_type.value,
+            "description": self.description,
+            "relationships": self._relationship_dicts(),
+            "timeframe": self._timeframe_dict(),
+            "tags": list(self.tags),
+            "references": self.references,
+            "metadata": self.metadata,
             "related_concepts": self.related_concepts,
             "formalized_by": self.formalized_by
-        })
-        return concept_dict
+        }
+
+def _compile_deserializer(cls):
+    """
+    Generate a straight-line function building a cls instance from its
+    to_dict() form: one assignment per slot, no __init__/__post_init__
+    """
+    json_fields = cls._JSON_FIELDS
+    missing = {f.name for f in fields(cls)} - json_fields.keys()
+    assert not missing, f"{cls.__name__}._JSON_FIELDS lacks {sorted(missing)}"
+    
+    lines = [
+        "def load(d, _new=object.__new__):",
+        "    _get = d.get",
+        "    rels = _get('relationships', [])",
+        "    tf = _get('timeframe')",
+        "    o = _new(_cls)"
+    ]
+    lines.extend(f"    o.{name} = {expr}" for name, expr in json_fields.items())
+    lines.append("    return o")
+    
+    namespace = {
+        "_cls": cls,
+        "_intern": _intern,
+        "_check_strength": _check_strength,
+        "_TYPE_BY_VALUE": _TYPE_BY_VALUE,
+        "_REL_CODE_BY_VALUE": _REL_CODE_BY_VALUE,
+        "OntologyType": OntologyType,
+        "TimeFrame": TimeFrame,
+        "array": array
+    }
+    exec(compile("\n".join(lines), f"<{cls.__name__} deserializer>", "exec"), namespace)
+    return namespace["load"]
+
+# Serialized type value -> deserializer; types without their own class load as OntologyEntity
+_DESERIALIZERS = dict.fromkeys(_TYPE_BY_VALUE, _compile_deserializer(OntologyEntity))
+_DESERIALIZERS[OntologyType.PERSON.value] = _compile_deserializer(Person)
+_DESERIALIZERS[OntologyType.CONCEPT.value] = _compile_deserializer(Concept)
 
 class CyberneticsOntology:
     def __init__(self):
         self.entities: Dict[str, OntologyEntity] = {}
+        # target_id -> [(source_id, position in the source's relationship arrays)]
+        self._inbound: Dict[str, List[Tuple[str, int]]] = defaultdict(list)
+        # Secondary indices; the dicts are used as insertion-ordered sets of entity ids
+        self._by_type: Dict[OntologyType, Dict[str, None]] = defaultdict(dict)
+        self._by_tag: Dict[str, Dict[str, None]] = defaultdict(dict)
         self.created_at = datetime.now()
-        self.last_updated = self.created_at
+        # last_updated is kept as a cheap integer timestamp and only turned into
+        # a datetime when read; _last_updated caches that datetime
+        self._last_updated_ns: Optional[int] = None
+        self._last_updated: Optional[datetime] = self.created_at
+    
+    @property
+    def last_updated(self) -> datetime:
+        """Time of the last change to the ontology"""
+        if self._last_updated is None:
+            ns = self._last_updated_ns
+            self._last_updated = datetime.fromtimestamp(ns // 1_000_000_000).replace(
+                microsecond=ns // 1000 % 1_000_000)
+        return self._last_updated
+    
+    @last_updated.setter
+    def last_updated(self, value: datetime):
+        self._last_updated = value
+    
+    def _touch(self):
+        """Record a change without building a datetime"""
+        self._last_updated_ns = time.time_ns()
+        self._last_updated = None
+    
+    def _index_entity(self, entity: OntologyEntity):
+        """Add an entity to the inbound, type and tag indices"""
+        eid = entity.id
+        for index, target_id in enumerate(entity.target_ids):
+            self._inbound[target_id].append((eid, index))
+        self._by_type[entity.entity_type][eid] = None
+        for tag in entity.tags:
+            self._by_tag[tag][eid] = None
+    
+    def _unindex_entity(self, entity: OntologyEntity):
+        """Remove an entity from the inbound, type and tag indices"""
+        eid = entity.id
+        for target_id in set(entity.target_ids):
+            self._inbound[target_id] = [
+                (source_id, index) for source_id, index in self._inbound[target_id]
+                if source_id != eid
+            ]
+        self._by_type[entity.entity_type].pop(eid, None)
+        for tag in entity.tags:
+            self._by_tag[tag].pop(eid, None)
+    
+    def _rebuild_indices(self):
+        """Recompute every index from scratch"""
+        self._inbound = defaultdict(list)
+        self._by_type = defaultdict(dict)
+        self._by_tag = defaultdict(dict)
+        for entity in self.entities.values():
+            self._index_entity(entity)
     
     def add_entity(self, entity: OntologyEntity):
-        """Add an entity to the ontology"""
+        """Add an entity to the ontology
+        
+        Relationships and tags added to the entity afterwards must go through
+        add_relationship_indexed and add_tag so the indices can see them.
+        """
+        previous = self.entities.get(entity.id)
+        if previous is not None:
+            self._unindex_entity(previous)
+        
         self.entities[entity.id] = entity
-        self.last_updated = datetime.now()
+        self._index_entity(entity)
+        self._touch()
+    
+    def add_relationship_indexed(self, source_id: str, target_id: str, rel_type: RelationshipType,
+                                 description: str = None, strength: int = 1):
+        """Add a relationship to an entity already in the ontology"""
+        source = self.entities[source_id]
+        source.add_relationship(target_id, rel_type, description, strength)
+        self._inbound[target_id].append((source_id, len(source.target_ids) - 1))
+        self._touch()
+    
+    def add_tag(self, entity_id: str, tag: str):
+        """Tag an entity already in the ontology"""
+        self.entities[entity_id].tags.add(tag)
+        self._by_tag[tag][entity_id] = None
+        self._touch()
     
     def get_entity(self, entity_id: str) -> Optional[OntologyEntity]:
         """Get an entity by ID"""
@@ -147,11 +400,13 @@ class CyberneticsOntology:
     
     def get_entities_by_type(self, entity_type: OntologyType) -> List[OntologyEntity]:
         """Get all entities of a specific type"""
-        return [e for e in self.entities.values() if e.entity_type == entity_type]
+        entities = self.entities
+        return [entities[eid] for eid in self._by_type.get(entity_type, ())]
     
     def get_entities_by_tag(self, tag: str) -> List[OntologyEntity]:
         """Get all entities with a specific tag"""
-        return [e for e in self.entities.values() if tag in e.tags]
+        entities = self.entities
+        return [entities[eid] for eid in self._by_tag.get(tag, ())]
     
     def get_related_entities(self, entity_id: str) -> Dict[str, List[Relationship]]:
         """Get all entities related to the given entity"""
@@ -162,29 +417,29 @@ class CyberneticsOntology:
         entity = self.entities[entity_id]
         
         # Direct relationships from this entity
-        for rel in entity.relationships:
-            if rel.target_id in self.entities:
-                if rel.target_id not in related:
-                    related[rel.target_id] = []
-                related[rel.target_id].append(rel)
+        for index, target_id in enumerate(entity.target_ids):
+            if target_id in self.entities:
+                if target_id not in related:
+                    related[target_id] = []
+                related[target_id].append(entity.relationship_at(index))
         
         # Relationships to this entity
-        for eid, e in self.entities.items():
+        for eid, index in self._inbound.get(entity_id, ()):
             if eid == entity_id:
                 continue
                 
-            for rel in e.relationships:
-                if rel.target_id == entity_id:
-                    if eid not in related:
-                        related[eid] = []
-                    # Create an inverse relationship object
-                    inverse_rel = Relationship(
-                        target_id=eid,
-                        relationship_type=rel.relationship_type,
-                        description=f"Inverse: {rel.description}" if rel.description else None,
-                        strength=rel.strength
-                    )
-                    related[eid].append(inverse_rel)
+            if eid not in related:
+                related[eid] = []
+            # Create an inverse relationship object
+            source = self.entities[eid]
+            description = source.descriptions[index]
+            inverse_rel = Relationship(
+                target_id=eid,
+                relationship_type=_REL_TYPES[source.rel_types[index]],
+                description=f"Inverse: {description}" if description else None,
+                strength=source.strengths[index]
+            )
+            related[eid].append(inverse_rel)
         
         return related
     
@@ -192,122 +447,104 @@ class CyberneticsOntology:
         """Find all paths between two entities up to a maximum depth"""
         if start_id not in self.entities or end_id not in self.entities:
             return []
-            
-        def dfs(current_id, target_id, path, visited, paths, depth):
-            if depth > max_depth:
-                return
-                
-            if current_id == target_id:
-                paths.append(path.copy())
-                return
-                
-            visited.add(current_id)
-            
-            entity = self.entities[current_id]
-            for rel in entity.relationships:
-                next_id = rel.target_id
-                if next_id not in visited and next_id in self.entities:
-                    path.append(next_id)
-                    dfs(next_id, target_id, path, visited, paths, depth + 1)
-                    path.pop()
-                    
-            visited.remove(current_id)
+        if max_depth < 0:
+            return []
+        if start_id == end_id:
+            return [[start_id]]
+        if max_depth == 0:
+            return []
         
+        # Iterative DFS: one relationship iterator per entity on the current path
+        entities = self.entities
         paths = []
-        dfs(start_id, end_id, [start_id], set(), paths, 0)
+        path = [start_id]
+        visited = {start_id}
+        stack = [iter(entities[start_id].target_ids)]
+        
+        while stack:
+            for next_id in stack[-1]:
+                if next_id in visited or next_id not in entities:
+                    continue
+                if next_id == end_id:
+                    paths.append(path + [end_id])
+                elif len(path) < max_depth:
+                    path.append(next_id)
+                    visited.add(next_id)
+                    stack.append(iter(entities[next_id].target_ids))
+                    break
+            else:
+                # Relationships exhausted: backtrack
+                stack.pop()
+                visited.discard(path.pop())
+        
         return paths
     
-    def to_json(self, filename: Optional[str] = None) -> str:
-        """Export the ontology to JSON"""
-        data = {
-            "metadata": {
-                "created_at": self.created_at.isoformat(),
-                "last_updated": self.last_updated.isoformat(),
-                "entity_count": len(self.entities)
-            },
-            "entities": {eid: entity.to_dict() for eid, entity in self.entities.items()}
+    def _metadata_dict(self) -> Dict:
+        """Document metadata written ahead of the entities"""
+        return {
+            "created_at": self.created_at.isoformat(),
+            "last_updated": self.last_updated.isoformat(),
+            "entity_count": len(self.entities)
         }
+    
+    def _write_json(self, f):
+        """Stream the indented JSON document to a binary file, one entity at a time
+        
+        Produces the same bytes as serializing the whole document at once;
+        nested values are re-indented by prefixing each of their lines, which
+        is safe because JSON strings never contain raw newlines.
+        """
+        f.write(b'{\n  "metadata": ')
+        f.write(_dumps_indented(self._metadata_dict()).replace(b'\n', b'\n  '))
+        f.write(b',\n  "entities": {')
+        separator = b'\n    '
+        for eid, entity in self.entities.items():
+            f.write(separator)
+            f.write(_dumps_indented(eid))
+            f.write(b': ')
+            f.write(_dumps_indented(entity.to_dict()).replace(b'\n', b'\n    '))
+            separator = b',\n    '
+        f.write(b'\n  }\n}' if self.entities else b'}\n}')
+    
+    def to_json(self, filename: Optional[str] = None) -> Optional[str]:
+        """Export the ontology to JSON
         
-        json_str = json.dumps(data, indent=2)
+        With a filename the document is streamed to disk and None is returned;
+        otherwise it is returned as a string.
+        """
         if filename:
-            with open(filename, 'w') as f:
-                f.write(json_str)
+            with open(filename, 'wb') as f:
+                self._write_json(f)
+            return None
         
-        return json_str
+        data = {
+            "metadata": self._metadata_dict(),
+            "entities": {eid: entity.to_dict() for eid, entity in self.entities.items()}
+        }
+        return _dumps_indented(data).decode('utf-8')
     
     @classmethod
     def from_json(cls, json_data: Union[str, Dict]) -> 'CyberneticsOntology':
         """Create an ontology from JSON data"""
         if isinstance(json_data, str):
             try:
-                with open(json_data, 'r') as f:
-                    data = json.load(f)
+                with open(json_data, 'rb') as f:
+                    data = _loads(f.read())
             except (FileNotFoundError, json.JSONDecodeError):
-                data = json.loads(json_data)
+                # orjson.JSONDecodeError subclasses json.JSONDecodeError
+                data = _loads(json_data)
         else:
             data = json_data
             
         ontology = cls()
         
         for eid, entity_data in data.get("entities", {}).items():
-            entity_type = entity_data.get("type")
-            
-            if entity_type == OntologyType.PERSON.value:
-                entity = Person(
-                    id=entity_data.get("id"),
-                    name=entity_data.get("name"),
-                    entity_type=OntologyType.PERSON,
-                    description=entity_data.get("description", ""),
-                    birth_year=entity_data.get("birth_year"),
-                    death_year=entity_data.get("death_year"),
-                    contributions=entity_data.get("contributions", []),
-                    institutions=entity_data.get("institutions", [])
-                )
-            elif entity_type == OntologyType.CONCEPT.value:
-                entity = Concept(
-                    id=entity_data.get("id"),
-                    name=entity_data.get("name"),
-                    entity_type=OntologyType.CONCEPT,
-                    description=entity_data.get("description", ""),
-                    related_concepts=entity_data.get("related_concepts", []),
-                    formalized_by=entity_data.get("formalized_by", [])
-                )
-            else:
-                entity = OntologyEntity(
-                    id=entity_data.get("id"),
-                    name=entity_data.get("name"),
-                    entity_type=OntologyType(entity_data.get("type")),
-                    description=entity_data.get("description", "")
-                )
-            
-            # Add timeframe if exists
-            if entity_data.get("timeframe"):
-                tf = entity_data["timeframe"]
-                entity.timeframe = TimeFrame(
-                    start_year=tf.get("start_year"),
-                    end_year=tf.get("end_year"),
-                    period_name=tf.get("period_name")
-                )
-            
-            # Add tags
-            entity.tags = set(entity_data.get("tags", []))
-            
-            # Add references
-            entity.references = entity_data.get("references", [])
-            
-            # Add metadata
-            entity.metadata = entity_data.get("metadata", {})
-            
-            # Add relationships
-            for rel_data in entity_data.get("relationships", []):
-                entity.add_relationship(
-                    target_id=rel_data.get("target"),
-                    rel_type=RelationshipType(rel_data.get("type")),
-                    description=rel_data.get("description"),
-                    strength=rel_data.get("strength", 1)
-                )
-            
-            ontology.add_entity(entity)
+            entity = _DESERIALIZERS[entity_data.get("type")](entity_data)
+            ontology.entities[entity.id] = entity
+        
+        # Build the indices in one pass instead of per entity
+        ontology._rebuild_indices()
+        ontology._touch()
         
         return ontology
 
@@ -1,171 +1,269 @@
+import os
 import re
 import json
+import tempfile
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import combinations
 from typing import Dict, List, Set, Tuple
 
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library encoder
+    orjson = None
+
+# Subsection title keywords that mark their items as people or concepts
+_PEOPLE_KEYWORDS = ("Key Figures", "Figures")
+_CONCEPT_KEYWORDS = ("Principles", "Concepts")
+
+# A whole line that is a numbered section heading ("3. Title")
+_SECTION_LINE_RE = re.compile(r'\d+\.\s+.+')
+# Section number and name within a heading
+_HEADING_RE = re.compile(r'(\d+)\.\s+(.+)')
+
+@dataclass(slots=True)
+class Node:
+    """A knowledge graph node; slotted to keep large graphs compact in memory"""
+    id: str
+    label: str
+    type: str
+
+@dataclass(slots=True)
+class Edge:
+    """A knowledge graph edge; slotted to keep large graphs compact in memory"""
+    source: str
+    target: str
+    label: str
+
+class _IdTranslationTable(dict):
+    """
+    str.translate table that keeps [a-z0-9_] and maps every other character
+    to '_'; code points outside ASCII are filled in lazily on first use
+    """
+    def __missing__(self, codepoint):
+        self[codepoint] = '_'
+        return '_'
+
+_ID_TABLE = _IdTranslationTable(
+    (i, chr(i) if chr(i) in 'abcdefghijklmnopqrstuvwxyz0123456789_' else '_')
+    for i in range(128)
+)
+
+@lru_cache(maxsize=None)
+def make_id(text: str) -> str:
+    """
+    Create a clean ID from text: lowercased, with any character outside
+    [a-z0-9_] replaced by an underscore (a single table-driven pass)
+    """
+    return text.lower().translate(_ID_TABLE)
+
+def _record_to_dict(obj):
+    """json fallback that serializes Node/Edge records as plain objects"""
+    return {name: getattr(obj, name) for name in obj.__slots__}
+
+if orjson is not None:
+    def _dumps(obj) -> bytes:
+        """Serialize to compact JSON bytes (section numbers are int keys)"""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+else:
+    def _dumps(obj) -> bytes:
+        """Serialize to compact JSON bytes"""
+        return json.dumps(obj, default=_record_to_dict, ensure_ascii=False).encode('utf-8')
+
+def _write_json_array(f, records) -> None:
+    """Write records to a binary file as a JSON array, one element at a time"""
+    f.write(b'[')
+    for i, record in enumerate(records):
+        if i:
+            f.write(b',')
+        f.write(_dumps(record))
+    f.write(b']')
+
 def parse_ontology_text(text: str) -> Dict:
     """
     Parse the ontology text document into a structured dictionary
+
+    A single pass over the lines: numbered headings open sections, and
+    within a section, blocks of lines separated by empty lines become
+    subsections (title line followed by item lines).
     """
-    # Split text into sections based on numbered headings
-    section_pattern = r'\n(\d+\.\s+[^\n]+)\n'
-    sections = re.split(section_pattern, text)
-    
-    # The first element is the header before any numbered sections
-    header = sections.pop(0).strip()
+    lines = text.split('\n')
+    last_index = len(lines) - 1
     
     structured_ontology = {}
+    subsections = None  # Subsections of the current section; None in the header
+    block = []
+    # A heading needs a newline of its own before it, so neither the first
+    # line nor the line right after another heading can be one
+    after_heading = True
     
-    # Process each section
-    for i in range(0, len(sections), 2):
-        if i + 1 < len(sections):
-            section_title = sections[i].strip()
-            section_content = sections[i + 1].strip()
+    for index, line in enumerate(lines):
+        if not after_heading and index < last_index and _SECTION_LINE_RE.fullmatch(line):
+            if subsections is not None:
+                _add_subsection(subsections, block)
+            block = []
+            after_heading = True
             
             # Extract section number and title
-            match = re.match(r'(\d+)\.\s+(.+)', section_title)
+            match = _HEADING_RE.match(line.strip())
             if match:
-                section_num = int(match.group(1))
-                section_name = match.group(2)
-                
-                # Parse subsections
-                subsections = parse_subsections(section_content)
-                
-                structured_ontology[section_num] = {
-                    "title": section_name,
+                subsections = {}
+                structured_ontology[int(match.group(1))] = {
+                    "title": match.group(2),
                     "subsections": subsections
                 }
+            else:
+                subsections = None
+            continue
+        
+        after_heading = False
+        if subsections is None:
+            continue
+        if line:
+            block.append(line)
+        else:
+            _add_subsection(subsections, block)
+            block = []
+    
+    if subsections is not None:
+        _add_subsection(subsections, block)
     
     return structured_ontology
 
+def _add_subsection(subsections: Dict, block: List[str]) -> None:
+    """
+    Add a block of lines as a subsection: the first non-blank line is the
+    title and the remaining non-blank lines are its items
+    """
+    title = None
+    items = []
+    for line in block:
+        line = line.strip()
+        if not line:
+            continue
+        if title is None:
+            title = line
+        else:
+            items.append(line)
+    
+    if title and items:
+        subsections[title] = items
+
 def parse_subsections(section_content: str) -> Dict:
     """
     Parse subsections within a main section
     """
-    # Split by double newlines to separate subsections
-    blocks = re.split(r'\n\n+', section_content)
     subsections = {}
+    block = []
     
-    for block in blocks:
-        lines = block.strip().split('\n')
-        if not lines:
-            continue
-            
-        # First line is the subsection title
-        subsection_title = lines[0].strip()
-        items = []
-        
-        # Remaining lines are the items
-        for line in lines[1:]:
-            line = line.strip()
-            if line:
-                items.append(line)
-        
-        if subsection_title and items:
-            subsections[subsection_title] = items
+    # Empty lines separate subsections
+    for line in section_content.split('\n'):
+        if line:
+            block.append(line)
+        else:
+            _add_subsection(subsections, block)
+            block = []
+    _add_subsection(subsections, block)
     
     return subsections
 
-def extract_entities(structured_ontology: Dict) -> Tuple[Set[str], Set[str], Dict[str, List[str]]]:
+def extract_entities(structured_ontology: Dict) -> Tuple[Set[str], Set[str], Dict[str, List[str]], Dict[str, str]]:
     """
-    Extract people, concepts, and domains from the structured ontology
+    Extract people, concepts, and domains from the structured ontology,
+    along with a mapping of every item to its node type ("person" or "concept")
     """
     people = set()
     concepts = set()
     domains = {}
+    item_types = {}
     
     # Extract people from Key Figures sections
     for section_num, section_data in structured_ontology.items():
         for subsection_name, items in section_data["subsections"].items():
-            if "Key Figures" in subsection_name or "Figures" in subsection_name:
-                for item in items:
-                    people.add(item)
-            elif "Principles" in subsection_name or "Concepts" in subsection_name:
+            # Decide the subsection's category once, then add its items in bulk
+            if any(k in subsection_name for k in _PEOPLE_KEYWORDS):
+                people.update(items)
+                # A person listing always wins over a concept listing elsewhere
+                item_types.update(dict.fromkeys(items, "person"))
+            else:
+                if any(k in subsection_name for k in _CONCEPT_KEYWORDS):
+                    concepts.update(items)
                 for item in items:
-                    concepts.add(item)
+                    item_types.setdefault(item, "concept")
             
             # Store items by subsection for domain organization
             domain_name = f"{section_data['title']} - {subsection_name}"
             domains[domain_name] = items
     
-    return people, concepts, domains
+    return people, concepts, domains, item_types
 
 def convert_to_knowledge_graph(structured_ontology: Dict) -> Dict:
     """
     Convert the structured ontology into a knowledge graph format
+    made of Node and Edge records
     """
-    people, concepts, domains_items = extract_entities(structured_ontology)
+    people, concepts, domains_items, item_types = extract_entities(structured_ontology)
     
     # Create nodes
     nodes = []
     edges = []
+    # Ids of every node appended so far, for O(1) duplicate checks
+    node_ids = set()
     
-    # Helper function to create a clean ID
-    def make_id(text):
-        return re.sub(r'[^a-z0-9_]', '_', text.lower())
+    # Id of every item, computed once and shared by the item and co-occurrence loops
+    item_ids = {
+        item: make_id(item)
+        for section_data in structured_ontology.values()
+        for items in section_data["subsections"].values()
+        for item in items
+    }
+    
+    # Subsection ids are scoped by their (unique) section id, so sections that
+    # share a title or a subsection name ("Overview", ...) never collide
+    subsection_node_ids = {
+        (section_num, subsection_name): f"section_{section_num}__{make_id(subsection_name)}"
+        for section_num, section_data in structured_ontology.items()
+        for subsection_name in section_data["subsections"]
+    }
     
     # Add section nodes
     for section_num, section_data in structured_ontology.items():
         section_id = f"section_{section_num}"
         section_title = section_data["title"]
         
-        nodes.append({
-            "id": section_id,
-            "label": section_title,
-            "type": "domain"
-        })
+        nodes.append(Node(section_id, section_title, "domain"))
+        node_ids.add(section_id)
         
         # Add subsection nodes and connect to sections
         for subsection_name, items in section_data["subsections"].items():
-            subsection_id = make_id(f"{section_title}_{subsection_name}")
+            subsection_id = subsection_node_ids[(section_num, subsection_name)]
             
-            nodes.append({
-                "id": subsection_id,
-                "label": subsection_name,
-                "type": "category"
-            })
+            nodes.append(Node(subsection_id, subsection_name, "category"))
+            node_ids.add(subsection_id)
             
             # Connect subsection to section
-            edges.append({
-                "source": section_id,
-                "target": subsection_id,
-                "label": "contains"
-            })
+            edges.append(Edge(section_id, subsection_id, "contains"))
             
             # Add items as nodes and connect to subsections
             for item in items:
-                item_id = make_id(item)
-                
-                # Determine item type
-                item_type = "person" if item in people else "concept"
+                item_id = item_ids[item]
                 
-                # Add item node if not already added
-                if not any(node["id"] == item_id for node in nodes):
-                    nodes.append({
-                        "id": item_id,
-                        "label": item,
-                        "type": item_type
-                    })
+                # Add item node if not already added; its type was resolved
+                # once per item by extract_entities
+                if item_id not in node_ids:
+                    nodes.append(Node(item_id, item, item_types[item]))
+                    node_ids.add(item_id)
                 
                 # Connect item to subsection
-                edges.append({
-                    "source": subsection_id,
-                    "target": item_id,
-                    "label": "includes"
-                })
+                edges.append(Edge(subsection_id, item_id, "includes"))
     
     # Add relationships between concepts based on co-occurrence
     for domain, items in domains_items.items():
         # Connect items within the same domain
-        for i, item1 in enumerate(items):
-            for item2 in items[i+1:]:
-                item1_id = make_id(item1)
-                item2_id = make_id(item2)
-                
-                edges.append({
-                    "source": item1_id,
-                    "target": item2_id,
-                    "label": "related_to"
-                })
+        edges.extend(
+            Edge(item_ids[item1], item_ids[item2], "related_to")
+            for item1, item2 in combinations(items, 2)
+        )
     
     return {
         "nodes": nodes,
@@ -185,12 +283,26 @@ def extract_text_to_json(input_file, output_file):
     # Convert to a knowledge graph format
     knowledge_graph = convert_to_knowledge_graph(structured_ontology)
     
-    # Save the results
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump({
-            "structured_ontology": structured_ontology,
-            "knowledge_graph": knowledge_graph
-        }, f, indent=2)
+    # Save the results, streaming nodes and edges so the whole document is
+    # never held in memory as a single serialized buffer. Written to a temp file
+    # and moved into place so readers (and concurrent writers) never see a partial file.
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(output_file) or '.', suffix='.tmp')
+    try:
+        with open(fd, 'wb', buffering=1 << 20) as f:
+            f.write(b'{"structured_ontology":')
+            f.write(_dumps(structured_ontology))
+            f.write(b',"knowledge_graph":{"nodes":')
+            _write_json_array(f, knowledge_graph["nodes"])
+            f.write(b',"edges":')
+            _write_json_array(f, knowledge_graph["edges"])
+            f.write(b'}}')
+        os.replace(tmp_path, output_file)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
     
     print(f"Ontology processed and saved to {output_file}")
     print(f"Found {len(knowledge_graph['nodes'])} nodes and {len(knowledge_graph['edges'])} relationships")
@@ -1,8 +1,33 @@
 import os
 import json
-from flask import Flask, request, render_template, jsonify, send_from_directory
+import hashlib
+import pickle
+import sys
+import tempfile
+import shutil
+import uuid
+import threading
+from collections import namedtuple, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, wraps
+from flask import Flask, request, render_template, send_from_directory, Response, g
 from werkzeug.utils import secure_filename
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from asgiref.wsgi import WsgiToAsgi
+except ImportError:
+    WsgiToAsgi = None
+
+try:
+    from whitenoise import WhiteNoise
+except ImportError:
+    WhiteNoise = None
+
 # Import our custom modules
 from ontology_parser import extract_text_to_json, analyze_ontology_structure
 from cybernetics_query_engine import CyberneticsQueryEngine
@@ -11,30 +36,264 @@ app = Flask(__name__)
 app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['DATA_FOLDER'] = 'data'
 
+# Serve static and template files from WhiteNoise's in-memory file index when it is installed;
+# the send_from_directory routes below remain the fallback
+if WhiteNoise is not None:
+    app.wsgi_app = WhiteNoise(app.wsgi_app, root=os.path.join(app.root_path, 'static'), prefix='static/', max_age=3600)
+    app.wsgi_app.add_files(os.path.join(app.root_path, 'templates'), prefix='templates/')
+
+# Buffer size for streaming uploads to disk
+UPLOAD_BUFFER_SIZE = 1 << 20
+
 # Make sure data directories exist
 os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 os.makedirs(app.config['DATA_FOLDER'], exist_ok=True)
 
-# Global variable for the query engine
-query_engine = None
+def ojson(obj, status=200):
+    """JSON response encoded with orjson when available (stdlib json otherwise)"""
+    if orjson is not None:
+        body = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        body = json.dumps(obj).encode()
+    return Response(body, status=status, mimetype="application/json")
+
+# Upper bound on /api/paths max_length; path counts (and cache entries) grow
+# combinatorially with it
+MAX_PATH_LENGTH = 5
+
+# The loaded query engine together with everything derived from it:
+#   version: bumped on every load; part of each memoized query's key so results
+#            from a previous ontology are never served (and age out of the LRU)
+#   graph_data, graph_data_etag: serialized /api/graph-data payload and its ETag
+EngineState = namedtuple('EngineState', ['engine', 'version', 'graph_data', 'graph_data_etag'])
+
+# Read-copy-update reference: load_query_engine builds a complete new state and swaps
+# it in with one assignment, so no lock is needed and readers always see an engine
+# together with its own version and graph-data payload
+_engine_ref = EngineState(None, 0, None, None)
+
+def iter_graph_data(graph):
+    """
+    Serialize a graph to the /api/graph-data payload one node/link at a time,
+    so the full nodes/links lists are never materialized
+    """
+    if orjson is not None:
+        dumps = orjson.dumps
+    else:
+        dumps = lambda obj: json.dumps(obj, separators=(",", ":")).encode()
+    
+    yield b'{"nodes":['
+    for i, (node_id, attrs) in enumerate(graph.nodes(data=True)):
+        chunk = dumps({"id": node_id, "label": attrs.get("label", node_id), "type": attrs.get("type", "unknown")})
+        yield b"," + chunk if i else chunk
+    
+    yield b'],"links":['
+    for i, (source, target, data) in enumerate(graph.edges(data=True)):
+        chunk = dumps({"source": source, "target": target, "label": data.get("label", "")})
+        yield b"," + chunk if i else chunk
+    yield b']}'
+
+def build_graph_data(graph):
+    """Serialize a graph to the visualization payload served by /api/graph-data"""
+    return b"".join(iter_graph_data(graph))
+
+def build_query_engine(data_file):
+    """Build the query engine from the ontology JSON, parsed with orjson when available"""
+    with open(data_file, 'rb') as f:
+        raw = f.read()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    return CyberneticsQueryEngine(data)
+
+# Suffix of the pickled engine written next to the ontology JSON file
+ENGINE_CACHE_SUFFIX = '.pkl'
+
+def load_cached_engine(data_file):
+    """
+    Load the query engine from its pickle sidecar, or build and cache it.
+    
+    Mirrors app/utils/engine_cache.py, which this standalone script can't import:
+    the sidecar stores the engine with the mtime/size of the JSON it was built
+    from, so any change to the JSON invalidates it; cache problems only mean a rebuild.
+    build_query_engine raises when the JSON can't be read, so a failed load is never cached.
+    """
+    st = os.stat(data_file)
+    key = (st.st_mtime_ns, st.st_size)
+    cache_file = data_file + ENGINE_CACHE_SUFFIX
+    
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_key, engine = pickle.load(f)
+        if cached_key == key:
+            return engine
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Ignoring unreadable engine cache {cache_file}: {e}", file=sys.stderr)
+    
+    engine = build_query_engine(data_file)
+    
+    # Write atomically so a concurrent reader never sees a partial pickle
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_file) or '.', suffix=ENGINE_CACHE_SUFFIX)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump((key, engine), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_file)
+    except Exception as e:
+        print(f"Could not write engine cache {cache_file}: {e}", file=sys.stderr)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    
+    return engine
 
 def load_query_engine():
     """Load the query engine with the latest data"""
-    global query_engine
+    global _engine_ref
     data_file = os.path.join(app.config['DATA_FOLDER'], 'cybernetics_ontology.json')
     
     if os.path.exists(data_file):
-        query_engine = CyberneticsQueryEngine(data_file)
+        engine = load_cached_engine(data_file)
+        graph_data = build_graph_data(engine.graph)
+        _engine_ref = EngineState(engine, _engine_ref.version + 1, graph_data, hashlib.md5(graph_data).hexdigest())
         return True
+    
+    _engine_ref = EngineState(None, _engine_ref.version + 1, None, None)
     return False
 
+class _StaleSnapshot(Exception):
+    """Raised inside a memoized lookup whose version is no longer the loaded one"""
+
+def _snapshot_cache(maxsize):
+    """
+    Memoize an engine lookup per engine version.
+
+    The decorated function takes the engine as its first argument; the returned
+    wrapper takes an EngineState snapshot instead. Results are keyed by the
+    snapshot's version only, so cache entries never pin an old graph, and a
+    result is only cached while that version is still the loaded one. Lookups
+    against a superseded snapshot are computed from its own engine, uncached.
+    """
+    def decorator(func):
+        @lru_cache(maxsize=maxsize)
+        def cached(version, *args):
+            state = _engine_ref
+            if state.version != version:
+                raise _StaleSnapshot  # exceptions are not cached
+            return func(state.engine, *args)
+        
+        @wraps(func)
+        def wrapper(state, *args):
+            try:
+                return cached(state.version, *args)
+            except _StaleSnapshot:
+                return func(state.engine, *args)
+        
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+    return decorator
+
+# Memoized query engine lookups; call with the request's EngineState snapshot (g.state)
+@_snapshot_cache(maxsize=4096)
+def _entity_cached(engine, entity_id):
+    return engine.query_entity(entity_id)
+
+@_snapshot_cache(maxsize=4096)
+def _related_cached(engine, concept_id, relationship_types):
+    return engine.get_related_concepts(concept_id, relationship_types)
+
+@_snapshot_cache(maxsize=1)
+def _hierarchy_cached(engine):
+    return engine.analyze_concept_hierarchy()
+
+@_snapshot_cache(maxsize=64)
+def _central_cached(engine, count):
+    return engine.get_central_entities(count)
+
+@_snapshot_cache(maxsize=8192)
+def _paths_cached(engine, source, target, max_length):
+    return engine.find_paths(source, target, max_length)
+
+# Rendered pages that depend only on the loaded ontology
+@_snapshot_cache(maxsize=4)
+def _ontology_html(engine):
+    return render_template('ontology.html', summary=engine.generate_ontology_summary())
+
+@_snapshot_cache(maxsize=4)
+def _browse_html(engine):
+    return render_template('browse.html', ontology=engine.structured_ontology)
+
 # Try to load the query engine at startup
 load_query_engine()
 
+# Ontology parsing runs in worker processes so uploads don't hold a request thread.
+# Running jobs: job id -> Future. Finished jobs: job id -> status dict, kept in LRU
+# order so repeated polls keep working (least recently polled dropped past MAX_FINISHED_JOBS)
+_pool = None
+_jobs = {}
+_finished_jobs = OrderedDict()
+MAX_FINISHED_JOBS = 256
+
+# Guards creating the pool and updating _finished_jobs
+_jobs_lock = threading.Lock()
+
+# Serializes engine reloads triggered by finishing jobs
+_reload_lock = threading.Lock()
+
+def get_parse_pool():
+    """Create the parsing process pool on first use"""
+    global _pool
+    if _pool is None:
+        with _jobs_lock:
+            if _pool is None:
+                _pool = ProcessPoolExecutor(max_workers=2)
+    return _pool
+
+def _finish_job(job_id, future):
+    """Done callback for a parsing job: reload the engine from the new data and record the outcome"""
+    error = future.exception()
+    if error is None:
+        try:
+            with _reload_lock:
+                load_query_engine()
+        except Exception as e:
+            error = e
+    
+    if error is None:
+        status = {"job_id": job_id, "status": "done"}
+    else:
+        status = {"job_id": job_id, "status": "failed", "error": f"Error processing file: {error}"}
+    
+    # Record the outcome before dropping the running entry so a poll always finds one of them
+    with _jobs_lock:
+        _finished_jobs[job_id] = status
+        while len(_finished_jobs) > MAX_FINISHED_JOBS:
+            _finished_jobs.popitem(last=False)
+    _jobs.pop(job_id, None)
+
+# Routes that need a loaded query engine; everything else (index, upload, job polling, templates) works without one
+_ENGINE_API_PREFIXES = ('/api/graph-data', '/api/entity/', '/api/search', '/api/paths', '/api/sections/', '/api/concepts/', '/api/hierarchy')
+_ENGINE_PAGE_PREFIXES = ('/ontology', '/explore', '/concept/', '/browse')
+
+@app.before_request
+def ensure_engine_loaded():
+    """Take the request's engine snapshot and short-circuit engine-backed routes while no ontology data is loaded"""
+    # Views read g.state only, so a reload mid-request can't mix two ontologies
+    # or swap in an empty engine after this check
+    g.state = _engine_ref
+    if g.state.engine is not None:
+        return None
+    
+    if request.path.startswith(_ENGINE_API_PREFIXES):
+        return ojson({"error": "No ontology data loaded"}, 404)
+    if request.path.startswith(_ENGINE_PAGE_PREFIXES):
+        return render_template('error.html', message="No ontology data loaded")
+    return None
+
 @app.route('/')
 def index():
     """Render the main page"""
-    return render_template('index.html', engine_loaded=query_engine is not None)
+    return render_template('index.html', engine_loaded=g.state.engine is not None)
 
 @app.route('/upload', methods=['GET', 'POST'])
 def upload_file():
@@ -42,197 +301,160 @@ def upload_file():
     if request.method == 'POST':
         # Check if the post request has the file part
         if 'ontology_file' not in request.files:
-            return jsonify({"error": "No file part"}), 400
+            return ojson({"error": "No file part"}, 400)
         
         file = request.files['ontology_file']
         
         # If user does not select file, browser also
         # submit an empty part without filename
         if file.filename == '':
-            return jsonify({"error": "No selected file"}), 400
+            return ojson({"error": "No selected file"}, 400)
         
         if file:
             filename = secure_filename(file.filename)
             filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-            file.save(filepath)
+            with open(filepath, 'wb', buffering=UPLOAD_BUFFER_SIZE) as out:
+                shutil.copyfileobj(file.stream, out, length=UPLOAD_BUFFER_SIZE)
             
-            # Process the file
+            # Process the file in the background; the engine is reloaded as soon as the job finishes
             try:
                 output_file = os.path.join(app.config['DATA_FOLDER'], 'cybernetics_ontology.json')
-                extract_markdown_to_json(filepath, output_file)
+                job_id = uuid.uuid4().hex
+                future = _jobs[job_id] = get_parse_pool().submit(extract_text_to_json, filepath, output_file)
+                future.add_done_callback(lambda f: _finish_job(job_id, f))
                 
-                # Load the query engine with the new data
-                load_query_engine()
-                
-                return jsonify({
+                return ojson({
                     "success": True,
-                    "message": "File processed successfully",
-                    "filename": filename
-                })
+                    "message": "File accepted for processing",
+                    "filename": filename,
+                    "job_id": job_id
+                }, 202)
             except Exception as e:
-                return jsonify({
+                return ojson({
                     "error": f"Error processing file: {str(e)}"
-                }), 500
+                }, 500)
     
     return render_template('upload.html')
 
+@app.route('/api/jobs/<job_id>')
+def get_job(job_id):
+    """API endpoint to poll a background parsing job"""
+    if job_id in _jobs:
+        return ojson({"job_id": job_id, "status": "running"})
+    
+    with _jobs_lock:
+        status = _finished_jobs.get(job_id)
+        if status is not None:
+            _finished_jobs.move_to_end(job_id)
+    if status is None:
+        return ojson({"error": f"Job '{job_id}' not found"}, 404)
+    
+    if status["status"] == "done":
+        status = {**status, "engine_loaded": g.state.engine is not None}
+    return ojson(status)
+
 @app.route('/ontology')
 def view_ontology():
     """Render the ontology visualization page"""
-    if query_engine is None:
-        return render_template('error.html', message="No ontology data loaded")
-    
-    summary = query_engine.generate_ontology_summary()
-    return render_template('ontology.html', summary=summary)
+    return _ontology_html(g.state)
 
 @app.route('/api/graph-data')
 def get_graph_data():
     """API endpoint to get graph data for visualization"""
-    if query_engine is None:
-        return jsonify({"error": "No ontology data loaded"}), 404
+    # The payload only changes when the engine is reloaded, so it is served pre-serialized
+    state = g.state
+    headers = {"ETag": f'"{state.graph_data_etag}"', "Cache-Control": "public, max-age=300"}
+    if state.graph_data_etag in request.if_none_match:
+        return Response(status=304, headers=headers)
     
-    # Convert graph to visualization format
-    nodes = []
-    for node_id in query_engine.graph.nodes():
-        attrs = query_engine.graph.nodes[node_id]
-        nodes.append({
-            "id": node_id,
-            "label": attrs.get("label", node_id),
-            "type": attrs.get("type", "unknown")
-        })
-    
-    links = []
-    for source, target, data in query_engine.graph.edges(data=True):
-        links.append({
-            "source": source,
-            "target": target,
-            "label": data.get("label", "")
-        })
-    
-    return jsonify({
-        "nodes": nodes,
-        "links": links
-    })
+    return Response(state.graph_data, mimetype="application/json", headers=headers)
 
 @app.route('/api/entity/<entity_id>')
 def get_entity(entity_id):
     """API endpoint to get entity details"""
-    if query_engine is None:
-        return jsonify({"error": "No ontology data loaded"}), 404
-    
-    entity_info = query_engine.query_entity(entity_id)
-    return jsonify(entity_info)
+    entity_info = _entity_cached(g.state, entity_id)
+    return ojson(entity_info)
 
 @app.route('/api/search')
 def search():
     """API endpoint to search entities"""
-    if query_engine is None:
-        return jsonify({"error": "No ontology data loaded"}), 404
-    
     query = request.args.get('q', '')
     entity_types = request.args.get('types', None)
     
     if entity_types:
         entity_types = entity_types.split(',')
     
-    results = query_engine.search_entities(query, entity_types)
-    return jsonify({"results": results})
+    results = g.state.engine.search_entities(query, entity_types)
+    return ojson({"results": results})
 
 @app.route('/api/paths')
 def find_paths():
     """API endpoint to find paths between entities"""
-    if query_engine is None:
-        return jsonify({"error": "No ontology data loaded"}), 404
-    
     source = request.args.get('source', '')
     target = request.args.get('target', '')
-    max_length = int(request.args.get('max_length', 3))
+    # Non-integer values fall back to the default instead of raising
+    max_length = max(1, min(request.args.get('max_length', 3, type=int), MAX_PATH_LENGTH))
     
-    paths = query_engine.find_paths(source, target, max_length)
-    return jsonify({"paths": paths})
+    paths = _paths_cached(g.state, source, target, max_length)
+    return ojson({"paths": paths})
 
 @app.route('/api/sections/topic/<topic>')
 def find_sections(topic):
     """API endpoint to find sections by topic"""
-    if query_engine is None:
-        return jsonify({"error": "No ontology data loaded"}), 404
-    
-    sections = query_engine.find_section_by_topic(topic)
-    return jsonify({"sections": sections})
+    sections = g.state.engine.find_section_by_topic(topic)
+    return ojson({"sections": sections})
 
 @app.route('/api/concepts/evolution')
 def get_concept_evolution():
     """API endpoint to get concept evolution chains"""
-    if query_engine is None:
-        return jsonify({"error": "No ontology data loaded"}), 404
-    
-    evolution_chains = query_engine.get_concept_evolution()
-    return jsonify({"evolution_chains": evolution_chains})
+    evolution_chains = g.state.engine.get_concept_evolution()
+    return ojson({"evolution_chains": evolution_chains})
 
 @app.route('/api/concepts/central')
 def get_central_concepts():
     """API endpoint to get central concepts"""
-    if query_engine is None:
-        return jsonify({"error": "No ontology data loaded"}), 404
-    
     count = int(request.args.get('count', 10))
-    central_entities = query_engine.get_central_entities(count)
-    return jsonify({"central_entities": central_entities})
+    central_entities = _central_cached(g.state, count)
+    return ojson({"central_entities": central_entities})
 
 @app.route('/api/concepts/related/<concept_id>')
 def get_related_concepts(concept_id):
     """API endpoint to get related concepts"""
-    if query_engine is None:
-        return jsonify({"error": "No ontology data loaded"}), 404
-    
     relationship_types = request.args.get('types', None)
     
-    if relationship_types:
-        relationship_types = relationship_types.split(',')
+    # A frozenset keys the cache the same regardless of query-string order
+    relationship_types = frozenset(relationship_types.split(',')) if relationship_types else None
     
-    related = query_engine.get_related_concepts(concept_id, relationship_types)
-    return jsonify(related)
+    related = _related_cached(g.state, concept_id, relationship_types)
+    return ojson(related)
 
 @app.route('/explore')
 def explore():
     """Render the explore page"""
-    if query_engine is None:
-        return render_template('error.html', message="No ontology data loaded")
-    
     return render_template('explore.html')
 
 @app.route('/concept/<concept_id>')
 def view_concept(concept_id):
     """Render the concept page"""
-    if query_engine is None:
-        return render_template('error.html', message="No ontology data loaded")
-    
-    concept_info = query_engine.query_entity(concept_id)
+    state = g.state
+    concept_info = _entity_cached(state, concept_id)
     
     if "error" in concept_info:
         return render_template('error.html', message=concept_info["error"])
     
-    related = query_engine.get_related_concepts(concept_id)
+    related = _related_cached(state, concept_id, None)
     return render_template('concept.html', concept=concept_info, related=related)
 
 @app.route('/browse')
 def browse_structure():
     """Render the browse page showing the ontology structure"""
-    if query_engine is None:
-        return render_template('error.html', message="No ontology data loaded")
-    
-    # Get the structured ontology
-    structured = query_engine.structured_ontology
-    return render_template('browse.html', ontology=structured)
+    return _browse_html(g.state)
 
 @app.route('/api/hierarchy')
 def get_hierarchy():
     """API endpoint to get concept hierarchy"""
-    if query_engine is None:
-        return jsonify({"error": "No ontology data loaded"}), 404
-    
-    hierarchy = query_engine.analyze_concept_hierarchy()
-    return jsonify(hierarchy)
+    hierarchy = _hierarchy_cached(g.state)
+    return ojson(hierarchy)
 
 # Templates and static files
 @app.route('/templates/<path:path>')
@@ -256,7 +478,18 @@ def list_templates():
         {"name": "browse.html", "description": "Browse ontology structure"},
         {"name": "error.html", "description": "Error page"}
     ]
-    return jsonify({"templates": templates})
+    return ojson({"templates": templates})
+
+# ASGI entrypoint when asgiref is installed, e.g. `uvicorn web-interface:asgi_app --workers 4`.
+# The engine state is only swapped wholesale on (re)load, never mutated, so views need no locking.
+if WsgiToAsgi is not None:
+    asgi_app = WsgiToAsgi(app)
+else:
+    def __getattr__(name):
+        """Explain a missing asgi_app instead of letting servers fail on an undefined name"""
+        if name == 'asgi_app':
+            raise ImportError("asgi_app requires asgiref: pip install asgiref")
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 if __name__ == '__main__':
     app.run(debug=True)
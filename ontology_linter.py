@@ -1,56 +1,87 @@
+import mmap
+import os
 import re
+from bisect import bisect_left
+
+# Every line the linter cares about, matched in one scan over the whole file:
+# optional leading whitespace, the directive, then the rest of the line.
+# Works on the raw bytes so the file can be scanned straight from an mmap.
+_DIRECTIVE_RE = re.compile(rb'^[ \t\r\x0b\x0c\x1c-\x1f]*(- Entity:|- Attribute:|Value:|- Relationship:|Target:)[^\n]*', re.M)
+_NEWLINE_RE = re.compile(rb'\n')
+
+# ASCII characters str.strip() treats as whitespace
+_WHITESPACE = b' \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f'
 
 def lint_ontology(path):
     issues = []
-    with open(path, 'r') as f:
-        lines = f.readlines()
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            data = b''
+        else:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        try:
+            _lint_directives(data, issues)
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+    
+    return issues
 
+def _lint_directives(data, issues):
+    """Check directive ordering and targets in the file contents, appending to issues"""
     current_entity = None
     expecting_value = False
     expecting_target = False
     defined_entities = set()
     
-    for i, line in enumerate(lines):
-        stripped = line.strip()
+    # Offsets of every newline, built on the first reported issue only
+    newlines = None
+    
+    def line_number(match):
+        nonlocal newlines
+        if newlines is None:
+            newlines = [nl.start() for nl in _NEWLINE_RE.finditer(data)]
+        return bisect_left(newlines, match.start()) + 1
+    
+    for m in _DIRECTIVE_RE.finditer(data):
+        directive = m.group(1)
         
-        if stripped.startswith("- Entity:"):
-            current_entity = stripped.split(": ", 1)[-1].strip()
+        if directive == b"- Entity:":
+            current_entity = _directive_argument(m)
             defined_entities.add(current_entity)
             expecting_value = expecting_target = False
         
-        elif stripped.startswith("- Attribute:"):
+        elif directive == b"- Attribute:":
             expecting_value = True
             expecting_target = False
         
-        elif stripped.startswith("Value:"):
+        elif directive == b"Value:":
             if not expecting_value:
-                issues.append(f"Line {i+1}: 'Value:' found without matching '- Attribute:'")
+                issues.append(f"Line {line_number(m)}: 'Value:' found without matching '- Attribute:'")
             expecting_value = False
         
-        elif stripped.startswith("- Relationship:"):
+        elif directive == b"- Relationship:":
             expecting_target = True
             expecting_value = False
         
-        elif stripped.startswith("Target:"):
+        else:  # Target:
             if not expecting_target:
-                issues.append(f"Line {i+1}: 'Target:' found without matching '- Relationship:'")
+                issues.append(f"Line {line_number(m)}: 'Target:' found without matching '- Relationship:'")
             else:
-                target_entity = stripped.split(": ", 1)[-1].strip()
+                target_entity = _directive_argument(m)
                 if target_entity not in defined_entities:
-                    issues.append(f"Line {i+1}: Target '{target_entity}' not defined as an entity")
+                    issues.append(f"Line {line_number(m)}: Target '{target_entity}' not defined as an entity")
             expecting_target = False
-        
-        elif stripped.startswith("Value:") or stripped.startswith("Target:"):
-            # Catch stray Value/Target
-            if not (expecting_value or expecting_target):
-                issues.append(f"Line {i+1}: Unexpected '{stripped}'")
     
     if expecting_value:
         issues.append("File ended while expecting a 'Value:' for an attribute.")
     if expecting_target:
         issues.append("File ended while expecting a 'Target:' for a relationship.")
 
-    return issues
+def _directive_argument(match):
+    """The text after a directive's ': ', decoded; only entity and target names are ever decoded"""
+    return match.group().strip(_WHITESPACE).split(b": ", 1)[-1].decode('utf-8').strip()
 
 # Usage
 issues = lint_ontology("test_input.md")
@@ -3,17 +3,35 @@
 Test script to add an entity to the Cybernetics Digital Garden via the API.
 
 Usage:
-    python test_add_entity.py [host] [port]
+    python test_add_entity.py [host] [port] [--bulk N]
 
 Arguments:
     host: API host (default: localhost)
     port: API port (default: 5001)
+    --bulk N: Create N test entities, sent in batches, instead of one
 """
 
 import sys
 import json
+import time
+import argparse
 import requests
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Shared session so repeated requests reuse pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=Retry(total=3, backoff_factor=0.1)))
+SESSION.headers.update({"Content-Type": "application/json"})
+
+# Entities per /api/entities:batch request used by --bulk (the server's maximum)
+BATCH_SIZE = 100
+
+# Retries for a batch rejected with 429 Too Many Requests, waiting Retry-After
+# seconds when the server sends it and RATE_LIMIT_BACKOFF * 2**attempt otherwise
+RATE_LIMIT_RETRIES = 5
+RATE_LIMIT_BACKOFF = 2
 
 def add_entity(base_url, entity_data):
     """
@@ -27,10 +45,9 @@ def add_entity(base_url, entity_data):
         Tuple of (success, response_data)
     """
     url = f"{base_url}/api/entities"
-    headers = {"Content-Type": "application/json"}
     
     try:
-        response = requests.post(url, json=entity_data, headers=headers)
+        response = SESSION.post(url, json=entity_data)
         response_data = response.json()
         
         if response.status_code == 201 and response_data.get("success"):
@@ -43,20 +60,19 @@ def add_entity(base_url, entity_data):
     except json.JSONDecodeError:
         return False, "Invalid JSON response"
 
-def main():
-    # Get host and port from command line args or use defaults
-    host = sys.argv[1] if len(sys.argv) > 1 else "localhost"
-    port = sys.argv[2] if len(sys.argv) > 2 else "5001"
-    
-    base_url = f"http://{host}:{port}"
-    print(f"Using API at {base_url}")
-    
-    # Current timestamp for creating a unique entity
-    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+def make_entity_data(timestamp, suffix=""):
+    """
+    Build sample entity data.
     
-    # Sample entity data
-    entity_data = {
-        "label": f"Test Entity {timestamp}",
+    Args:
+        timestamp: Timestamp making the entity label unique
+        suffix: Optional extra label suffix (used to tell bulk entities apart)
+        
+    Returns:
+        Dictionary with entity data
+    """
+    return {
+        "label": f"Test Entity {timestamp}{suffix}",
         "type": "concept",
         "description": "A test entity created via the API",
         "external_url": "https://example.com/test-entity",
@@ -66,6 +82,87 @@ def main():
             "timestamp": timestamp
         }
     }
+
+def add_entities_batch(base_url, entities):
+    """
+    Add several entities to the knowledge graph in one request.
+    
+    Args:
+        base_url: Base URL of the API
+        entities: List of entity data dictionaries
+        
+    Returns:
+        Tuple of (success, response_data)
+    """
+    url = f"{base_url}/api/entities:batch"
+    
+    try:
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            response = SESSION.post(url, json={"entities": entities})
+            if response.status_code != 429 or attempt == RATE_LIMIT_RETRIES:
+                break
+            retry_after = response.headers.get("Retry-After", "")
+            delay = int(retry_after) if retry_after.isdigit() else RATE_LIMIT_BACKOFF * 2 ** attempt
+            print(f"Rate limited, retrying batch in {delay}s")
+            time.sleep(delay)
+        
+        response_data = response.json()
+        
+        if response.status_code == 201 and response_data.get("success"):
+            return True, response_data
+        else:
+            error_msg = response_data.get("error", "Unknown error")
+            return False, error_msg
+    except requests.exceptions.RequestException as e:
+        return False, f"Request failed: {str(e)}"
+    except json.JSONDecodeError:
+        return False, "Invalid JSON response"
+
+def add_entities_bulk(base_url, entities, batch_size=BATCH_SIZE):
+    """
+    Add many entities as a sequence of batch requests, preserving their order.
+    
+    Args:
+        base_url: Base URL of the API
+        entities: List of entity data dictionaries
+        batch_size: Number of entities per request
+        
+    Returns:
+        Tuple of (number of entities created, error message or None)
+    """
+    created = 0
+    for start in range(0, len(entities), batch_size):
+        success, result = add_entities_batch(base_url, entities[start:start + batch_size])
+        if not success:
+            return created, result
+        created += result.get("count", 0)
+    return created, None
+
+def main():
+    parser = argparse.ArgumentParser(description="Add test entities via the API")
+    parser.add_argument("host", nargs="?", default="localhost", help="API host")
+    parser.add_argument("port", nargs="?", default="5001", help="API port")
+    parser.add_argument("--bulk", type=int, default=0, metavar="N", help="Create N entities in batches")
+    args = parser.parse_args()
+    
+    base_url = f"http://{args.host}:{args.port}"
+    print(f"Using API at {base_url}")
+    
+    # Current timestamp for creating a unique entity
+    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    
+    if args.bulk > 0:
+        print(f"\nAttempting to create {args.bulk} entities")
+        created, error = add_entities_bulk(base_url, [make_entity_data(timestamp, f"-{i}") for i in range(args.bulk)])
+        
+        print(f"\nCreated {created} of {args.bulk} entities")
+        if error:
+            print(f"❌ Failed to create entities: {error}")
+            sys.exit(1)
+        return
+    
+    # Sample entity data
+    entity_data = make_entity_data(timestamp)
     
     print(f"\nAttempting to create entity: {entity_data['label']}")
     
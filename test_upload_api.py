@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Smoke test for the legacy web interface upload path (old/web-interface.py).
+
+Uploads an ontology text file, then polls the background parsing job until
+the new query engine is loaded.
+
+Usage:
+    python test_upload_api.py [host] [port] [--file PATH]
+
+Arguments:
+    host: Web interface host (default: localhost)
+    port: Web interface port (default: 5000)
+    --file PATH: Ontology text file to upload (default: old/ontology.txt)
+"""
+
+import sys
+import json
+import time
+import argparse
+import requests
+
+# How long to wait for the background parse before giving up
+POLL_INTERVAL = 0.5
+POLL_TIMEOUT = 60
+
+def upload_file(base_url, path):
+    """
+    Upload an ontology file.
+
+    Args:
+        base_url: Base URL of the web interface
+        path: Path of the file to upload
+
+    Returns:
+        Tuple of (success, job_id or error message)
+    """
+    url = f"{base_url}/upload"
+
+    try:
+        with open(path, 'rb') as f:
+            response = requests.post(url, files={"ontology_file": f})
+        response_data = response.json()
+
+        if response.status_code == 202 and response_data.get("job_id"):
+            return True, response_data["job_id"]
+        else:
+            error_msg = response_data.get("error", "Unknown error")
+            return False, error_msg
+    except requests.exceptions.RequestException as e:
+        return False, f"Request failed: {str(e)}"
+    except json.JSONDecodeError:
+        return False, "Invalid JSON response"
+
+def wait_for_job(base_url, job_id):
+    """
+    Poll a parsing job until it finishes.
+
+    Args:
+        base_url: Base URL of the web interface
+        job_id: ID returned by the upload
+
+    Returns:
+        Tuple of (success, job status data or error message)
+    """
+    url = f"{base_url}/api/jobs/{job_id}"
+    deadline = time.monotonic() + POLL_TIMEOUT
+
+    try:
+        while time.monotonic() < deadline:
+            response_data = requests.get(url).json()
+            status = response_data.get("status")
+
+            if status == "done":
+                return True, response_data
+            if status != "running":
+                return False, response_data.get("error", "Unknown error")
+            time.sleep(POLL_INTERVAL)
+    except requests.exceptions.RequestException as e:
+        return False, f"Request failed: {str(e)}"
+    except json.JSONDecodeError:
+        return False, "Invalid JSON response"
+
+    return False, f"Job did not finish within {POLL_TIMEOUT} seconds"
+
+def main():
+    parser = argparse.ArgumentParser(description="Upload an ontology via the legacy web interface")
+    parser.add_argument("host", nargs="?", default="localhost", help="Web interface host")
+    parser.add_argument("port", nargs="?", default="5000", help="Web interface port")
+    parser.add_argument("--file", default="old/ontology.txt", help="Ontology text file to upload")
+    args = parser.parse_args()
+
+    base_url = f"http://{args.host}:{args.port}"
+    print(f"Using web interface at {base_url}")
+
+    print(f"\nUploading {args.file}")
+    success, result = upload_file(base_url, args.file)
+    if not success:
+        print(f"\n❌ Upload failed: {result}")
+        sys.exit(1)
+
+    print(f"Parsing job {result} started, waiting for it to finish")
+    success, result = wait_for_job(base_url, result)
+    if not success:
+        print(f"\n❌ Parsing failed: {result}")
+        sys.exit(1)
+
+    if not result.get("engine_loaded"):
+        print("\n❌ Parsing finished but no query engine was loaded")
+        sys.exit(1)
+
+    print("\n✅ Ontology uploaded, parsed and loaded successfully!")
+    print(f"\nYou can explore the graph data at:")
+    print(f"{base_url}/api/graph-data")
+
+if __name__ == "__main__":
+    main()